@@ -0,0 +1,59 @@
+"""
+Shared helpers for Alembic data migrations
+
+Importable from revision scripts as ``from _helpers import paged_update``
+(env.py puts this directory on sys.path).
+"""
+
+from typing import Any, Callable, Sequence
+
+from alembic import op
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+
+def paged_update(
+    conn: Connection,
+    select_stmt: Select,
+    update_fn: Callable[[Connection, Sequence[Any]], None],
+    page_size: int = 2000,
+) -> int:
+    """
+    Run a data migration over select_stmt in pages, committing each page.
+
+    The first selected column must be a unique, sortable key (normally the
+    primary key); pages are read with keyset pagination on it, so no page
+    re-scans rows already processed and memory stays O(page_size).
+    update_fn(conn, rows) writes one page, ideally as a single executemany:
+
+        conn.execute(
+            table.update().where(table.c.id == sa.bindparam("_id")),
+            [{"_id": row.id, "tags": fix(row.tags)} for row in rows],
+        )
+
+    Pages run inside an autocommit block, so each page is durable as soon as
+    it is written and a failed run can simply be re-run; update_fn must
+    therefore be idempotent. Returns the number of rows processed.
+    """
+    key = select_stmt.selected_columns[0]
+    last_key = None
+    processed = 0
+    
+    with op.get_context().autocommit_block():
+        while True:
+            page_stmt = select_stmt.order_by(key).limit(page_size)
+            if last_key is not None:
+                page_stmt = page_stmt.where(key > last_key)
+            
+            rows = conn.execute(page_stmt).all()
+            if not rows:
+                break
+            
+            update_fn(conn, rows)
+            processed += len(rows)
+            last_key = rows[-1][0]
+            
+            if len(rows) < page_size:
+                break
+    
+    return processed
@@ -1,5 +1,6 @@
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config
+from sqlalchemy import event
 from sqlalchemy import pool
 from alembic import context
 import os
@@ -7,9 +8,12 @@ import sys
 
 # Add the parent directory to the path so we can import our models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# ...and this directory, so revisions can import shared helpers from _helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.models.database import Base
 from app.core.config import settings
+from app.core.database import set_sqlite_pragmas
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -71,6 +75,10 @@ def run_migrations_online() -> None:
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
+    
+    # Same WAL/cache tuning as the application engines
+    if connectable.dialect.name == "sqlite":
+        event.listen(connectable, "connect", set_sqlite_pragmas)
 
     with connectable.connect() as connection:
         context.configure(
@@ -4,6 +4,23 @@ Revision ID: 001
 Revises: 
 Create Date: 2025-07-03 07:00:00.000000
 
+This revision is the template for later ones: create tables, load data,
+then create indexes. Data migrations must not load a whole table and
+commit once; page through it with _helpers.paged_update instead:
+
+    from _helpers import paged_update
+
+    def upgrade() -> None:
+        content = sa.table('content', sa.column('id'), sa.column('tags'))
+        paged_update(
+            op.get_bind(),
+            sa.select(content.c.id, content.c.tags),
+            lambda conn, rows: conn.execute(
+                content.update().where(content.c.id == sa.bindparam('_id')),
+                [{'_id': row.id, 'tags': row.tags or '[]'} for row in rows],
+            ),
+        )
+
 """
 from alembic import op
 import sqlalchemy as sa
@@ -15,7 +32,8 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
+def create_tables() -> None:
+    """Create the projects and content tables without secondary indexes"""
     # Create projects table
     op.create_table('projects',
         sa.Column('id', sa.Integer(), nullable=False),
@@ -32,14 +50,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
     
-    # Create indexes for projects table
-    op.create_index(op.f('ix_projects_id'), 'projects', ['id'], unique=False)
-    op.create_index(op.f('ix_projects_platform'), 'projects', ['platform'], unique=False)
-    op.create_index(op.f('ix_projects_url'), 'projects', ['url'], unique=True)
-    op.create_index(op.f('ix_projects_name'), 'projects', ['name'], unique=False)
-    op.create_index(op.f('ix_projects_language'), 'projects', ['language'], unique=False)
-    op.create_index(op.f('ix_projects_status'), 'projects', ['status'], unique=False)
-    
     # Create content table
     op.create_table('content',
         sa.Column('id', sa.Integer(), nullable=False),
@@ -56,6 +66,17 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
+
+
+def create_indexes() -> None:
+    """Create secondary indexes; run only after any bulk data load"""
+    # Create indexes for projects table
+    op.create_index(op.f('ix_projects_id'), 'projects', ['id'], unique=False)
+    op.create_index(op.f('ix_projects_platform'), 'projects', ['platform'], unique=False)
+    op.create_index(op.f('ix_projects_url'), 'projects', ['url'], unique=True)
+    op.create_index(op.f('ix_projects_name'), 'projects', ['name'], unique=False)
+    op.create_index(op.f('ix_projects_language'), 'projects', ['language'], unique=False)
+    op.create_index(op.f('ix_projects_status'), 'projects', ['status'], unique=False)
     
     # Create indexes for content table
     op.create_index(op.f('ix_content_id'), 'content', ['id'], unique=False)
@@ -65,6 +86,18 @@ def upgrade() -> None:
     op.create_index(op.f('ix_content_status'), 'content', ['status'], unique=False)
 
 
+def upgrade() -> None:
+    create_tables()
+    
+    # Any bulk data load (COPY/INSERT backfill) belongs here, before the
+    # indexes exist, so B-tree maintenance isn't paid per inserted row
+    
+    create_indexes()
+    
+    # Refresh planner statistics now that the indexes exist
+    op.execute("ANALYZE")
+
+
 def downgrade() -> None:
     # Drop content table
     op.drop_index(op.f('ix_content_status'), table_name='content')
@@ -0,0 +1,32 @@
+"""Add compound indexes for content list filters
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-07-04 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # project_id first (equality, high cardinality), status/content_type after
+    # so prefix lookups on project_id alone still use the index
+    op.create_index('ix_content_project_status_type', 'content', ['project_id', 'status', 'content_type'], unique=False)
+    # Catalog-wide listings filtered by status and/or content type
+    op.create_index('ix_content_status_type', 'content', ['status', 'content_type'], unique=False)
+    
+    # Covered by the leading column of ix_content_project_status_type
+    op.drop_index(op.f('ix_content_project_id'), table_name='content')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_content_project_id'), 'content', ['project_id'], unique=False)
+    op.drop_index('ix_content_status_type', table_name='content')
+    op.drop_index('ix_content_project_status_type', table_name='content')
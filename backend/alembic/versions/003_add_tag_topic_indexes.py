@@ -0,0 +1,72 @@
+"""Index JSON tags/topics for element lookups
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-07-04 10:00:00.000000
+
+projects.topics and content.tags hold JSON arrays as TEXT, so filtering
+by one element needs a full scan with LIKE. On PostgreSQL add a generated
+JSONB column with a GIN index (queried with @>); on SQLite add an FTS5
+index over the JSON text, kept in sync by triggers.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+JSON_ARRAY_COLUMNS = [('projects', 'topics'), ('content', 'tags')]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    
+    for table, column in JSON_ARRAY_COLUMNS:
+        fts = f"{table}_{column}_fts"
+        
+        if dialect == 'postgresql':
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column}_jsonb JSONB "
+                f"GENERATED ALWAYS AS (CAST({column} AS JSONB)) STORED"
+            )
+            op.execute(
+                f"CREATE INDEX ix_{table}_{column}_gin ON {table} "
+                f"USING gin ({column}_jsonb jsonb_path_ops)"
+            )
+        elif dialect == 'sqlite':
+            op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({column}, content='{table}', content_rowid='id')")
+            op.execute(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+                f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+            )
+            # Index existing rows
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    
+    for table, column in reversed(JSON_ARRAY_COLUMNS):
+        fts = f"{table}_{column}_fts"
+        
+        if dialect == 'postgresql':
+            op.drop_index(f"ix_{table}_{column}_gin", table_name=table)
+            op.drop_column(table, f"{column}_jsonb")
+        elif dialect == 'sqlite':
+            op.execute(f"DROP TRIGGER {fts}_au")
+            op.execute(f"DROP TRIGGER {fts}_ad")
+            op.execute(f"DROP TRIGGER {fts}_ai")
+            op.execute(f"DROP TABLE {fts}")
@@ -0,0 +1,60 @@
+"""Store tags/topics as native JSON
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-07-05 09:00:00.000000
+
+projects.topics and content.tags move from JSON-encoded TEXT to JSONB on
+PostgreSQL, converted in place, and the GIN indexes move from the
+generated <column>_jsonb columns of 003 onto the columns themselves.
+SQLite keeps the JSON text (its JSON type is stored as TEXT), so there
+only NULLs are normalized to empty arrays.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+JSON_ARRAY_COLUMNS = [('projects', 'topics'), ('content', 'tags')]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    
+    for table, column in JSON_ARRAY_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = '[]' WHERE {column} IS NULL OR {column} = ''")
+        
+        if dialect == 'postgresql':
+            op.drop_index(f"ix_{table}_{column}_gin", table_name=table)
+            op.drop_column(table, f"{column}_jsonb")
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+            )
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '[]'::jsonb")
+            op.execute(
+                f"CREATE INDEX ix_{table}_{column}_gin ON {table} "
+                f"USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    
+    for table, column in reversed(JSON_ARRAY_COLUMNS):
+        if dialect == 'postgresql':
+            op.drop_index(f"ix_{table}_{column}_gin", table_name=table)
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TEXT USING {column}::text")
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column}_jsonb JSONB "
+                f"GENERATED ALWAYS AS (CAST({column} AS JSONB)) STORED"
+            )
+            op.execute(
+                f"CREATE INDEX ix_{table}_{column}_gin ON {table} "
+                f"USING gin ({column}_jsonb jsonb_path_ops)"
+            )
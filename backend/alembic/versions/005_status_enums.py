@@ -0,0 +1,53 @@
+"""Store project/content status as SQL enums
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-07-05 10:00:00.000000
+
+On PostgreSQL projects.status and content.status become native ENUM
+types (project_status, content_status), converted in place. SQLite has no
+enum type and stores the same strings, so there only NULL statuses are
+backfilled; the CHECK constraints apply to databases built by create_all().
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+STATUS_ENUMS = [
+    ('projects', 'project_status', 'discovered',
+     ('discovered', 'analyzed', 'processed', 'published', 'archived')),
+    ('content', 'content_status', 'draft',
+     ('draft', 'enhanced', 'published', 'archived')),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    
+    for table, type_name, default, values in STATUS_ENUMS:
+        op.execute(f"UPDATE {table} SET status = '{default}' WHERE status IS NULL")
+        
+        if bind.dialect.name == 'postgresql':
+            sa.Enum(*values, name=type_name).create(bind, checkfirst=True)
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status TYPE {type_name} USING status::{type_name}")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status SET DEFAULT '{default}'")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status SET NOT NULL")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    
+    for table, type_name, default, values in reversed(STATUS_ENUMS):
+        if bind.dialect.name == 'postgresql':
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status DROP NOT NULL")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status TYPE VARCHAR(20) USING status::text")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN status SET DEFAULT '{default}'")
+            sa.Enum(*values, name=type_name).drop(bind, checkfirst=True)
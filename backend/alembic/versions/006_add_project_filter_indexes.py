@@ -0,0 +1,33 @@
+"""Add compound indexes for project list filters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-07-05 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # list_projects filters by platform or language, usually with status, and
+    # pages in id order; trailing id lets the index return rows in page order
+    op.create_index('ix_projects_platform_status', 'projects', ['platform', 'status', 'id'], unique=False)
+    op.create_index('ix_projects_language_status', 'projects', ['language', 'status', 'id'], unique=False)
+    
+    # Covered by the leading columns of the indexes above
+    op.drop_index(op.f('ix_projects_platform'), table_name='projects')
+    op.drop_index(op.f('ix_projects_language'), table_name='projects')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_projects_language'), 'projects', ['language'], unique=False)
+    op.create_index(op.f('ix_projects_platform'), 'projects', ['platform'], unique=False)
+    op.drop_index('ix_projects_language_status', table_name='projects')
+    op.drop_index('ix_projects_platform_status', table_name='projects')
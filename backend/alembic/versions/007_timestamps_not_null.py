@@ -0,0 +1,37 @@
+"""Make projects.scraped_at and content.created_at NOT NULL
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-07-05 12:00:00.000000
+
+Both columns already default to CURRENT_TIMESTAMP on the server (001);
+the models now rely on that default alone. Backfill any NULLs, then add
+NOT NULL on PostgreSQL (on SQLite that needs a table rebuild, which would
+drop the FTS triggers from 003, so it is left to create_all()).
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [('projects', 'scraped_at'), ('content', 'created_at')]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE {column} IS NULL")
+        if dialect == 'postgresql':
+            op.alter_column(table, column, existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, column in reversed(TIMESTAMP_COLUMNS):
+            op.alter_column(table, column, existing_type=sa.DateTime(), nullable=True)
@@ -7,7 +7,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta
 import logging
 
-from ..core.auth import authenticate_user, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from ..core.auth import authenticate_user, create_access_token, get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES
 from ..models.schemas import Token, APIResponse
 
 logger = logging.getLogger(__name__)
@@ -26,7 +26,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     - Username: `admin`, Password: `admin123` (admin permissions)
     - Username: `user`, Password: `user123` (read/write permissions)
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    user = await authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -50,13 +50,14 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         expires_delta=access_token_expires
     )
     
-    logger.info(
-        f"User logged in: {user['username']}",
-        extra={
-            "username": user["username"],
-            "permissions": user["permissions"]
-        }
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User logged in: %s", user['username'],
+            extra={
+                "username": user["username"],
+                "permissions": user["permissions"]
+            }
+        )
     
     return {
         "access_token": access_token,
@@ -96,7 +97,3 @@ async def logout():
         message="Logout successful. Please discard your access token.",
         data={"logged_out": True}
     )
-
-
-# Import at the end to avoid circular imports
-from ..core.auth import get_current_active_user
@@ -3,26 +3,133 @@ Content API Endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+import csv
+import io
 import logging
+import orjson
 
-from ..core.database import get_db
+from ..core.database import get_db, SessionLocal
+from ..core.cache import cached_response, invalidate_cache
+from ..core.responses import MsgspecJSONResponse
 from ..core.auth import get_current_active_user, require_permissions, get_current_user_optional
 from ..models.schemas import (
     Content, ContentCreate, ContentUpdate,
-    APIResponse, PaginatedResponse, TokenData
+    APIResponse, PaginatedResponse, TokenData,
+    ContentRow, PaginatedContentResponse
 )
 from ..services.database_service import (
-    create_content, get_content, get_content_list,
-    update_content, delete_content, get_content_by_slug,
-    get_project  # To validate project exists
+    create_content, create_content_bulk, get_content, get_content_summary, content_exists,
+    get_content_summaries, count_content, iter_content, iter_content_text,
+    update_content, delete_content, get_content_by_slug
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/content", tags=["content"])
 
+CACHE_NAMESPACE = "content"
+
+# Maximum number of items accepted by POST /content/bulk
+BULK_CREATE_LIMIT = 1000
+
+# Columns written by GET /content/export
+EXPORT_COLUMNS = [
+    "id", "project_id", "content_type", "title", "slug", "raw_content",
+    "enhanced_content", "meta_description", "tags", "status", "created_at"
+]
+
+
+def _stream_content_response(message: str, content_data: dict, content_id: int, fields: List[str]):
+    """
+    Yield an APIResponse JSON body whose data includes the given TEXT fields,
+    streamed chunk by chunk from the database instead of built in memory.
+    Runs in the threadpool with its own session, as the request session may
+    be closed once the endpoint returns.
+    """
+    envelope = orjson.dumps({"success": True, "message": message, "data": content_data})
+    # Reopen the data object: strip the closing "}}" of data and envelope
+    yield envelope[:-2]
+    
+    db = SessionLocal()
+    try:
+        for field in fields:
+            yield b',"' + field.encode() + b'":"'
+            for chunk in iter_content_text(db, content_id, field):
+                # JSON-escape the chunk without the surrounding quotes
+                yield orjson.dumps(chunk)[1:-1]
+            yield b'"'
+    finally:
+        db.close()
+    
+    yield b"}}"
+
+
+def _csv_value(value):
+    """CSV cell for a column value; lists (tags) are written as JSON arrays"""
+    if isinstance(value, list):
+        return orjson.dumps(value).decode()
+    return value
+
+
+def _stream_content_csv(filters: dict, flush_size: int = 65536):
+    """
+    Yield content matching the filters as CSV, one buffer at a time.
+    Rows are streamed from the database so memory stays bounded.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    
+    db = SessionLocal()
+    try:
+        for content in iter_content(db, filters=filters):
+            writer.writerow([_csv_value(getattr(content, column)) for column in EXPORT_COLUMNS])
+            if buffer.tell() >= flush_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    finally:
+        db.close()
+    
+    yield buffer.getvalue()
+
+
+def _integrity_violation(error: IntegrityError) -> Optional[str]:
+    """
+    Which kind of constraint an IntegrityError violated: "foreign_key",
+    "unique", or None for anything else (NOT NULL, CHECK, ...).
+    PostgreSQL reports SQLSTATE codes; SQLite only has the message text.
+    """
+    code = getattr(error.orig, "pgcode", None)
+    message = str(error.orig).lower()
+    
+    if code == "23503" or "foreign key" in message:
+        return "foreign_key"
+    if code == "23505" or "unique" in message:
+        return "unique"
+    return None
+
+
+def _raise_for_integrity_error(error: IntegrityError, project_id: Optional[int], slug: Optional[str]):
+    """Map a content constraint violation to the matching HTTP error"""
+    violation = _integrity_violation(error)
+    
+    if violation == "foreign_key":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID {project_id} not found"
+        )
+    if violation == "unique":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Content with slug '{slug}' already exists"
+        )
+    raise error
+
 
 @router.get("", response_model=PaginatedResponse)
 async def list_content(
@@ -31,6 +138,7 @@ async def list_content(
     project_id: Optional[int] = Query(None, description="Filter by project ID"),
     content_type: Optional[str] = Query(None, description="Filter by content type"),
     status: Optional[str] = Query(None, description="Filter by status"),
+    tag: Optional[str] = Query(None, description="Filter by tag"),
     db: Session = Depends(get_db),
     current_user: Optional[TokenData] = Depends(get_current_user_optional)
 ):
@@ -48,43 +156,47 @@ async def list_content(
             filters['content_type'] = content_type.lower()
         if status:
             filters['status'] = status.lower()
+        if tag:
+            filters['tag'] = tag
             
-        content_list = get_content_list(db, skip=skip, limit=limit, filters=filters)
-        total = len(get_content_list(db, skip=0, limit=10000, filters=filters))  # TODO: Optimize with count query
+        content_list = get_content_summaries(db, skip=skip, limit=limit, filters=filters)
+        total = count_content(db, filters=filters)
         
         # Calculate pagination info
         pages = (total + limit - 1) // limit
         page = (skip // limit) + 1
         
-        # Convert to dict for response
+        # Convert to structs for response
         content_data = [
-            {
-                "id": c.id,
-                "project_id": c.project_id,
-                "content_type": c.content_type,
-                "title": c.title,
-                "slug": c.slug,
-                "meta_description": c.meta_description,
-                "tags": c.tags,
-                "status": c.status,
-                "created_at": c.created_at.isoformat(),
+            ContentRow(
+                id=c.id,
+                project_id=c.project_id,
+                content_type=c.content_type,
+                title=c.title,
+                slug=c.slug,
+                meta_description=c.meta_description,
+                tags=c.tags,
+                status=c.status,
+                created_at=c.created_at,
                 # Include content lengths instead of full content for list view
-                "raw_content_length": len(c.raw_content) if c.raw_content else 0,
-                "enhanced_content_length": len(c.enhanced_content) if c.enhanced_content else 0
-            }
-            for c in content_list
+                raw_content_length=raw_content_length,
+                enhanced_content_length=enhanced_content_length
+            )
+            for c, raw_content_length, enhanced_content_length in content_list
         ]
         
-        logger.info(
-            f"Listed {len(content_list)} content items",
-            extra={
-                "user": current_user.username if current_user else "anonymous",
-                "filters": filters,
-                "pagination": {"skip": skip, "limit": limit}
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Listed %d content items", len(content_list),
+                extra={
+                    "user": current_user.username if current_user else "anonymous",
+                    "filters": filters,
+                    "pagination": {"skip": skip, "limit": limit}
+                }
+            )
         
-        return PaginatedResponse(
+        # Encoded by msgspec; the response_model above documents the same shape
+        return MsgspecJSONResponse(PaginatedContentResponse(
             success=True,
             message=f"Retrieved {len(content_list)} content items",
             data=content_data,
@@ -92,7 +204,7 @@ async def list_content(
             page=page,
             per_page=limit,
             pages=pages
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error listing content: {e}")
@@ -102,6 +214,45 @@ async def list_content(
         )
 
 
+@router.get("/export")
+async def export_content(
+    project_id: Optional[int] = Query(None, description="Filter by project ID"),
+    content_type: Optional[str] = Query(None, description="Filter by content type"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    tag: Optional[str] = Query(None, description="Filter by tag"),
+    current_user: Optional[TokenData] = Depends(get_current_user_optional)
+):
+    """
+    Export content as CSV, with the same filters as the list endpoint.
+    
+    Rows are streamed as they are read, so exports of any size use constant memory.
+    """
+    filters = {}
+    if project_id:
+        filters['project_id'] = project_id
+    if content_type:
+        filters['content_type'] = content_type.lower()
+    if status:
+        filters['status'] = status.lower()
+    if tag:
+        filters['tag'] = tag
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Exporting content",
+            extra={
+                "user": current_user.username if current_user else "anonymous",
+                "filters": filters
+            }
+        )
+    
+    return StreamingResponse(
+        _stream_content_csv(filters),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="content.csv"'}
+    )
+
+
 @router.post("", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_content(
     content: ContentCreate,
@@ -114,35 +265,25 @@ async def create_new_content(
     Requires authentication and 'write' permission.
     """
     try:
-        # Validate that project exists
-        project = get_project(db, content.project_id)
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project with ID {content.project_id} not found"
-            )
+        # Missing projects and duplicate slugs are rejected by the
+        # content.project_id foreign key and the unique slug index
+        try:
+            new_content = create_content(db, content)
+        except IntegrityError as e:
+            _raise_for_integrity_error(e, content.project_id, content.slug)
+        await invalidate_cache(CACHE_NAMESPACE)
         
-        # Check if content with this slug already exists
-        existing = get_content_by_slug(db, content.slug)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Content with slug '{content.slug}' already exists"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created new content: %s", new_content.title,
+                extra={
+                    "user": current_user.username,
+                    "content_id": new_content.id,
+                    "project_id": new_content.project_id,
+                    "content_type": new_content.content_type
+                }
             )
         
-        # Create the content
-        new_content = create_content(db, content)
-        
-        logger.info(
-            f"Created new content: {new_content.title}",
-            extra={
-                "user": current_user.username,
-                "content_id": new_content.id,
-                "project_id": new_content.project_id,
-                "content_type": new_content.content_type
-            }
-        )
-        
         return APIResponse(
             success=True,
             message=f"Content '{new_content.title}' created successfully",
@@ -164,6 +305,74 @@ async def create_new_content(
         )
 
 
+@router.post("/bulk", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
+async def create_content_batch(
+    contents: List[ContentCreate],
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(require_permissions("write"))
+):
+    """
+    Create many content entries in a single statement.
+    
+    Items whose slug already exists are skipped rather than failing the batch.
+    Requires authentication and 'write' permission.
+    """
+    if len(contents) > BULK_CREATE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_CREATE_LIMIT} items can be created per request"
+        )
+    
+    try:
+        try:
+            created = create_content_bulk(db, contents)
+        except IntegrityError as e:
+            violation = _integrity_violation(e)
+            if violation == "foreign_key":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="One or more referenced projects not found"
+                )
+            if violation == "unique":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="The batch conflicts with existing content"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="One or more items violate a content constraint"
+            )
+        await invalidate_cache(CACHE_NAMESPACE)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Bulk created %d content items", created,
+                extra={
+                    "user": current_user.username,
+                    "requested": len(contents),
+                    "created_count": created
+                }
+            )
+        
+        return APIResponse(
+            success=True,
+            message=f"Created {created} of {len(contents)} content items",
+            data={
+                "created": created,
+                "skipped": len(contents) - created
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk creating content: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create content"
+        )
+
+
 @router.get("/{content_id}", response_model=APIResponse)
 async def get_content_details(
     content_id: int,
@@ -179,12 +388,13 @@ async def get_content_details(
     Content inclusion is controlled by query parameters to manage response size.
     """
     try:
-        content = get_content(db, content_id)
-        if not content:
+        summary = get_content_summary(db, content_id)
+        if not summary:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Content with ID {content_id} not found"
             )
+        content, raw_content_length, enhanced_content_length = summary
         
         content_data = {
             "id": content.id,
@@ -195,32 +405,42 @@ async def get_content_details(
             "meta_description": content.meta_description,
             "tags": content.tags,
             "status": content.status,
-            "created_at": content.created_at.isoformat()
+            "created_at": content.created_at,
+            # Always include content lengths
+            "raw_content_length": raw_content_length,
+            "enhanced_content_length": enhanced_content_length
         }
         
         # Include content based on query parameters
-        if include_raw and content.raw_content:
-            content_data["raw_content"] = content.raw_content
-        if include_enhanced and content.enhanced_content:
-            content_data["enhanced_content"] = content.enhanced_content
-            
-        # Always include content lengths
-        content_data["raw_content_length"] = len(content.raw_content) if content.raw_content else 0
-        content_data["enhanced_content_length"] = len(content.enhanced_content) if content.enhanced_content else 0
+        fields = []
+        if include_raw and raw_content_length:
+            fields.append("raw_content")
+        if include_enhanced and enhanced_content_length:
+            fields.append("enhanced_content")
         
-        logger.info(
-            f"Retrieved content details: {content.title}",
-            extra={
-                "user": current_user.username if current_user else "anonymous",
-                "content_id": content_id,
-                "include_raw": include_raw,
-                "include_enhanced": include_enhanced
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Retrieved content details: %s", content.title,
+                extra={
+                    "user": current_user.username if current_user else "anonymous",
+                    "content_id": content_id,
+                    "include_raw": include_raw,
+                    "include_enhanced": include_enhanced
+                }
+            )
+        
+        message = f"Content '{content.title}' retrieved successfully"
+        
+        # Large TEXT columns are streamed rather than loaded into the response
+        if fields:
+            return StreamingResponse(
+                _stream_content_response(message, content_data, content_id, fields),
+                media_type="application/json"
+            )
         
         return APIResponse(
             success=True,
-            message=f"Content '{content.title}' retrieved successfully",
+            message=message,
             data=content_data
         )
         
@@ -247,42 +467,29 @@ async def update_content_details(
     Requires authentication and 'write' permission.
     """
     try:
-        content = get_content(db, content_id)
-        if not content:
+        if not content_exists(db, content_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Content with ID {content_id} not found"
             )
         
-        # If project_id is being updated, validate the new project exists
-        if content_update.project_id and content_update.project_id != content.project_id:
-            project = get_project(db, content_update.project_id)
-            if not project:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Project with ID {content_update.project_id} not found"
-                )
-        
-        # If slug is being updated, check for conflicts
-        if content_update.slug and content_update.slug != content.slug:
-            existing = get_content_by_slug(db, content_update.slug)
-            if existing and existing.id != content_id:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Content with slug '{content_update.slug}' already exists"
-                )
-        
-        # Update the content
-        updated_content = update_content(db, content_id, content_update)
+        # Update the content; a missing new project or a conflicting slug is
+        # rejected by the database constraints
+        try:
+            updated_content = update_content(db, content_id, content_update)
+        except IntegrityError as e:
+            _raise_for_integrity_error(e, content_update.project_id, content_update.slug)
+        await invalidate_cache(CACHE_NAMESPACE)
         
-        logger.info(
-            f"Updated content: {updated_content.title}",
-            extra={
-                "user": current_user.username,
-                "content_id": content_id,
-                "changes": content_update.dict(exclude_unset=True)
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updated content: %s", updated_content.title,
+                extra={
+                    "user": current_user.username,
+                    "content_id": content_id,
+                    "changes": content_update.model_dump(exclude_unset=True)
+                }
+            )
         
         return APIResponse(
             success=True,
@@ -316,7 +523,7 @@ async def delete_content_record(
     Requires authentication and 'delete' permission.
     """
     try:
-        content = get_content(db, content_id)
+        content = get_content(db, content_id, text_fields=())
         if not content:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -325,9 +532,10 @@ async def delete_content_record(
         
         content_title = content.title
         delete_content(db, content_id)
+        await invalidate_cache(CACHE_NAMESPACE)
         
         logger.warning(
-            f"Deleted content: {content_title}",
+            "Deleted content: %s", content_title,
             extra={
                 "user": current_user.username,
                 "content_id": content_id
@@ -351,6 +559,7 @@ async def delete_content_record(
 
 
 @router.get("/by-slug/{slug}", response_model=APIResponse)
+@cached_response(CACHE_NAMESPACE)
 async def get_content_by_slug_endpoint(
     slug: str,
     include_raw: bool = Query(False, description="Include raw content in response"),
@@ -364,7 +573,12 @@ async def get_content_by_slug_endpoint(
     This endpoint is useful for public content access and SEO-friendly URLs.
     """
     try:
-        content = get_content_by_slug(db, slug)
+        # Load only the bodies this response includes
+        text_fields = [
+            field for field, wanted in (("raw_content", include_raw), ("enhanced_content", include_enhanced))
+            if wanted
+        ]
+        content = get_content_by_slug(db, slug, text_fields=text_fields)
         if not content:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -380,7 +594,7 @@ async def get_content_by_slug_endpoint(
             "meta_description": content.meta_description,
             "tags": content.tags,
             "status": content.status,
-            "created_at": content.created_at.isoformat()
+            "created_at": content.created_at
         }
         
         # Include content based on query parameters (enhanced by default for public access)
@@ -389,14 +603,15 @@ async def get_content_by_slug_endpoint(
         if include_enhanced and content.enhanced_content:
             content_data["enhanced_content"] = content.enhanced_content
             
-        logger.info(
-            f"Retrieved content by slug: {slug}",
-            extra={
-                "user": current_user.username if current_user else "anonymous",
-                "content_id": content.id,
-                "slug": slug
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Retrieved content by slug: %s", slug,
+                extra={
+                    "user": current_user.username if current_user else "anonymous",
+                    "content_id": content.id,
+                    "slug": slug
+                }
+            )
         
         return APIResponse(
             success=True,
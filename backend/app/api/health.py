@@ -2,12 +2,14 @@
 Health check endpoints
 """
 
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
+import asyncio
 import psutil
 import platform
 import logging
+import time
 
 from ..core.config import settings
 from ..core.database import get_db, get_connection_info, test_connection
@@ -16,6 +18,66 @@ from ..services.database_service import get_database_stats
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Static system information - doesn't change for the life of the process
+_SYSTEM_INFO = {
+    "platform": platform.system(),
+    "platform_release": platform.release(),
+    "platform_version": platform.version(),
+    "architecture": platform.machine(),
+    "hostname": platform.node(),
+    "processor": platform.processor(),
+}
+
+# Prime psutil's CPU counters so later non-blocking calls return real values
+psutil.cpu_percent(interval=None)
+
+# CPU/memory snapshot, refreshed by sample_performance_info() in the background
+PERFORMANCE_SAMPLE_INTERVAL_SECONDS = 5.0
+_performance_info = {}
+
+# Short-lived caches so frequent load balancer probes stay cheap
+_DB_CONNECTION_TTL_SECONDS = 2.0
+_DB_STATS_TTL_SECONDS = 30.0
+_cache = {}
+
+
+def _cache_get(key: str):
+    """Return a cached value, or None if missing or expired"""
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _cache_set(key: str, value, ttl: float):
+    """Cache a value for ttl seconds"""
+    _cache[key] = (time.monotonic() + ttl, value)
+    return value
+
+
+def _collect_performance_info():
+    """Gather CPU and memory usage (blocking psutil syscalls)"""
+    memory = psutil.virtual_memory()
+    return {
+        "cpu_usage_percent": psutil.cpu_percent(interval=None),
+        "memory_total_gb": round(memory.total / (1024**3), 2),
+        "memory_available_gb": round(memory.available / (1024**3), 2),
+        "memory_usage_percent": memory.percent,
+    }
+
+
+async def sample_performance_info(interval: float = PERFORMANCE_SAMPLE_INTERVAL_SECONDS):
+    """
+    Refresh the shared CPU/memory snapshot every interval seconds.
+    Started as a background task by the application lifespan.
+    """
+    while True:
+        try:
+            _performance_info.update(await asyncio.to_thread(_collect_performance_info))
+        except Exception as e:
+            logger.warning(f"Performance sampling failed: {e}")
+        await asyncio.sleep(interval)
+
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check():
@@ -24,26 +86,11 @@ async def health_check():
     Returns application health status and system information
     """
     try:
-        # System information
-        system_info = {
-            "platform": platform.system(),
-            "platform_release": platform.release(),
-            "platform_version": platform.version(),
-            "architecture": platform.machine(),
-            "hostname": platform.node(),
-            "processor": platform.processor(),
-        }
-        
-        # Memory and CPU info
-        memory = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=1)
-        
-        performance_info = {
-            "cpu_usage_percent": cpu_percent,
-            "memory_total_gb": round(memory.total / (1024**3), 2),
-            "memory_available_gb": round(memory.available / (1024**3), 2),
-            "memory_usage_percent": memory.percent,
-        }
+        # Memory and CPU info from the background sampler; sample once
+        # if it isn't running (e.g. the app was started without lifespan)
+        if not _performance_info:
+            _performance_info.update(await asyncio.to_thread(_collect_performance_info))
+        performance_info = dict(_performance_info)
         
         health_data = {
             "status": "healthy",
@@ -67,7 +114,7 @@ async def health_check():
                 "docs": "/docs",
                 "health_db": "/api/health/database"
             },
-            "system": system_info,
+            "system": _SYSTEM_INFO,
             "performance": performance_info,
         }
         
@@ -100,14 +147,22 @@ async def simple_health_check():
 
 
 @router.get("/health/database", status_code=status.HTTP_200_OK)
-async def database_health_check(db: Session = Depends(get_db)):
+async def database_health_check(
+    full: bool = Query(False, description="Bypass cached connectivity and statistics"),
+    db: Session = Depends(get_db)
+):
     """
     Database health check endpoint
     Returns database connectivity status and statistics
+    
+    Connectivity is cached for 2 seconds and statistics for 30 seconds;
+    pass full=true to query the database directly.
     """
     try:
         # Test database connection
-        db_connected = await test_connection()
+        db_connected = None if full else _cache_get("db_connected")
+        if db_connected is None:
+            db_connected = _cache_set("db_connected", await test_connection(), _DB_CONNECTION_TTL_SECONDS)
         
         # Get connection info
         connection_info = get_connection_info()
@@ -116,7 +171,11 @@ async def database_health_check(db: Session = Depends(get_db)):
         db_stats = {}
         if db_connected:
             try:
-                db_stats = get_database_stats(db)
+                db_stats = None if full else _cache_get("db_stats")
+                if db_stats is None:
+                    db_stats = await asyncio.to_thread(get_database_stats, db)
+                    if "error" not in db_stats:
+                        _cache_set("db_stats", db_stats, _DB_STATS_TTL_SECONDS)
             except Exception as stats_error:
                 logger.warning(f"Could not retrieve database stats: {stats_error}")
                 db_stats = {"error": "Stats unavailable"}
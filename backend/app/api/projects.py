@@ -3,39 +3,68 @@ Project API Endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import logging
 
-from ..core.database import get_db
+from ..core.database import get_async_db
 from ..core.auth import get_current_active_user, require_permissions, get_current_user_optional
+from ..core.cache import cached_response, invalidate_cache
+from .content import CACHE_NAMESPACE as CONTENT_CACHE_NAMESPACE
+from ..core.responses import MsgspecJSONResponse, ORJSONResponse
+from ..models.database import Project as ProjectModel
 from ..models.schemas import (
     Project, ProjectCreate, ProjectUpdate, 
-    APIResponse, PaginatedResponse, TokenData
+    APIResponse, PaginatedResponse, TokenData,
+    ProjectRow, PaginatedProjectResponse
 )
 from ..services.database_service import (
-    create_project, get_project, get_projects, 
-    update_project, delete_project, get_project_by_url
+    create_project, get_project, get_projects, count_projects, cursor_get_projects, encode_cursor,
+    update_project, delete_project
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+CACHE_NAMESPACE = "projects"
+
+# Columns returned by list_projects; selected directly instead of loading entities
+PROJECT_LIST_COLUMNS = (
+    ProjectModel.id,
+    ProjectModel.platform,
+    ProjectModel.url,
+    ProjectModel.name,
+    ProjectModel.description,
+    ProjectModel.stars,
+    ProjectModel.language,
+    ProjectModel.topics,
+    ProjectModel.quality_score,
+    ProjectModel.status,
+    ProjectModel.scraped_at,
+)
+
 
 @router.get("", response_model=PaginatedResponse)
+@cached_response(CACHE_NAMESPACE)
 async def list_projects(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor (next_cursor of a previous page); skip is ignored"),
     platform: Optional[str] = Query(None, description="Filter by platform"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     language: Optional[str] = Query(None, description="Filter by programming language"),
-    db: Session = Depends(get_db),
+    topic: Optional[str] = Query(None, description="Filter by topic"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[TokenData] = Depends(get_current_user_optional)
 ):
     """
     List discovered projects with optional filtering and pagination.
     
+    Pages can be fetched by offset (skip/limit) or, more efficiently for deep
+    pages, by passing the next_cursor returned with each page as cursor.
+    Cursor pages skip the count: their total and pages are null.
+    
     This endpoint supports optional authentication - authenticated users may see additional data.
     """
     try:
@@ -43,55 +72,63 @@ async def list_projects(
         filters = {}
         if platform:
             filters['platform'] = platform.lower()
-        if status:
-            filters['status'] = status.lower()
+        if status_filter:
+            filters['status'] = status_filter.lower()
         if language:
             filters['language'] = language
-            
-        projects = get_projects(db, skip=skip, limit=limit, filters=filters)
-        total = len(get_projects(db, skip=0, limit=10000, filters=filters))  # TODO: Optimize with count query
+        if topic:
+            filters['topic'] = topic
         
-        # Calculate pagination info
-        pages = (total + limit - 1) // limit
-        page = (skip // limit) + 1
+        if cursor:
+            try:
+                projects, next_cursor = await cursor_get_projects(
+                    db, cursor=cursor, per_page=limit, filters=filters, columns=PROJECT_LIST_COLUMNS
+                )
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor"
+                )
+            # Cursor pages continue from an offset page that already
+            # reported the total; skip the COUNT(*) on every later page
+            total = None
+            pages = None
+            page = None
+        else:
+            projects = await get_projects(db, skip=skip, limit=limit, filters=filters, columns=PROJECT_LIST_COLUMNS)
+            total = await count_projects(db, filters=filters)
+            page = (skip // limit) + 1
+            # Let offset clients switch to cursor pagination from any page
+            next_cursor = encode_cursor(projects[-1].id) if projects and skip + len(projects) < total else None
+            pages = (total + limit - 1) // limit
         
-        # Convert to dict for response
-        projects_data = [
-            {
-                "id": p.id,
-                "platform": p.platform,
-                "url": p.url,
-                "name": p.name,
-                "description": p.description,
-                "stars": p.stars,
-                "language": p.language,
-                "topics": p.topics,
-                "quality_score": p.quality_score,
-                "status": p.status,
-                "scraped_at": p.scraped_at.isoformat()
-            }
-            for p in projects
-        ]
+        # Convert to structs for response (trusted DB rows, no validation)
+        projects_data = [ProjectRow(**row._mapping) for row in projects]
         
-        logger.info(
-            f"Listed {len(projects)} projects",
-            extra={
-                "user": current_user.username if current_user else "anonymous",
-                "filters": filters,
-                "pagination": {"skip": skip, "limit": limit}
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Listed %d projects", len(projects),
+                extra={
+                    "user": current_user.username if current_user else "anonymous",
+                    "filters": filters,
+                    "pagination": {"skip": skip, "limit": limit}
+                }
+            )
         
-        return PaginatedResponse(
+        # Encoded by msgspec; the response_model above documents the same shape
+        return MsgspecJSONResponse(PaginatedProjectResponse(
             success=True,
             message=f"Retrieved {len(projects)} projects",
             data=projects_data,
             total=total,
             page=page,
             per_page=limit,
-            pages=pages
-        )
+            pages=pages,
+            next_cursor=next_cursor
+        ))
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
         raise HTTPException(
@@ -103,7 +140,7 @@ async def list_projects(
 @router.post("", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_project(
     project: ProjectCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: TokenData = Depends(require_permissions("write"))
 ):
     """
@@ -112,25 +149,24 @@ async def create_new_project(
     Requires authentication and 'write' permission.
     """
     try:
-        # Check if project already exists
-        existing = get_project_by_url(db, project.url)
-        if existing:
+        # Create the project; None means the URL is already taken
+        new_project = await create_project(db, project)
+        if new_project is None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Project with URL '{project.url}' already exists"
             )
+        await invalidate_cache(CACHE_NAMESPACE)
         
-        # Create the project
-        new_project = create_project(db, project)
-        
-        logger.info(
-            f"Created new project: {new_project.name}",
-            extra={
-                "user": current_user.username,
-                "project_id": new_project.id,
-                "platform": new_project.platform
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created new project: %s", new_project.name,
+                extra={
+                    "user": current_user.username,
+                    "project_id": new_project.id,
+                    "platform": new_project.platform
+                }
+            )
         
         return APIResponse(
             success=True,
@@ -154,9 +190,10 @@ async def create_new_project(
 
 
 @router.get("/{project_id}", response_model=APIResponse)
+@cached_response(CACHE_NAMESPACE)
 async def get_project_details(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[TokenData] = Depends(get_current_user_optional)
 ):
     """
@@ -165,7 +202,7 @@ async def get_project_details(
     Optional authentication - authenticated users may see additional details.
     """
     try:
-        project = get_project(db, project_id)
+        project = await get_project(db, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -183,22 +220,24 @@ async def get_project_details(
             "topics": project.topics,
             "quality_score": project.quality_score,
             "status": project.status,
-            "scraped_at": project.scraped_at.isoformat()
+            "scraped_at": project.scraped_at
         }
         
-        logger.info(
-            f"Retrieved project details: {project.name}",
-            extra={
-                "user": current_user.username if current_user else "anonymous",
-                "project_id": project_id
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Retrieved project details: %s", project.name,
+                extra={
+                    "user": current_user.username if current_user else "anonymous",
+                    "project_id": project_id
+                }
+            )
         
-        return APIResponse(
-            success=True,
-            message=f"Project '{project.name}' retrieved successfully",
-            data=project_data
-        )
+        # Encoded by orjson as-is; the response_model above documents the same shape
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Project '{project.name}' retrieved successfully",
+            "data": project_data
+        })
         
     except HTTPException:
         raise
@@ -214,7 +253,7 @@ async def get_project_details(
 async def update_project_details(
     project_id: int,
     project_update: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: TokenData = Depends(require_permissions("write"))
 ):
     """
@@ -223,24 +262,25 @@ async def update_project_details(
     Requires authentication and 'write' permission.
     """
     try:
-        project = get_project(db, project_id)
-        if not project:
+        # Update the project; no row back means it doesn't exist
+        changes = project_update.model_dump(exclude_unset=True)
+        updated_project = await update_project(db, project_id, changes)
+        if updated_project is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with ID {project_id} not found"
             )
+        await invalidate_cache(CACHE_NAMESPACE)
         
-        # Update the project
-        updated_project = update_project(db, project_id, project_update)
-        
-        logger.info(
-            f"Updated project: {updated_project.name}",
-            extra={
-                "user": current_user.username,
-                "project_id": project_id,
-                "changes": project_update.dict(exclude_unset=True)
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updated project: %s", updated_project.name,
+                extra={
+                    "user": current_user.username,
+                    "project_id": project_id,
+                    "changes": changes
+                }
+            )
         
         return APIResponse(
             success=True,
@@ -265,7 +305,7 @@ async def update_project_details(
 @router.delete("/{project_id}", response_model=APIResponse)
 async def delete_project_record(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: TokenData = Depends(require_permissions("delete"))
 ):
     """
@@ -274,18 +314,18 @@ async def delete_project_record(
     Requires authentication and 'delete' permission.
     """
     try:
-        project = get_project(db, project_id)
-        if not project:
+        project_name = await delete_project(db, project_id)
+        if project_name is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with ID {project_id} not found"
             )
-        
-        project_name = project.name
-        delete_project(db, project_id)
+        # Deleting a project also deletes its content
+        await invalidate_cache(CACHE_NAMESPACE)
+        await invalidate_cache(CONTENT_CACHE_NAMESPACE)
         
         logger.warning(
-            f"Deleted project: {project_name}",
+            "Deleted project: %s", project_name,
             extra={
                 "user": current_user.username,
                 "project_id": project_id
@@ -7,8 +7,13 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from functools import lru_cache
+from collections import OrderedDict
+import asyncio
+import hashlib
 import logging
+import time
 
 from ..core.config import settings
 from ..models.schemas import TokenData, User
@@ -16,7 +21,13 @@ from ..models.schemas import TokenData, User
 logger = logging.getLogger(__name__)
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# Recent successful password checks, so repeated logins skip bcrypt.
+# Keyed by (sha256(password), hash); in memory only, never persisted.
+PASSWORD_CACHE_TTL_SECONDS = 60
+PASSWORD_CACHE_MAX_ENTRIES = 1024
+_verified_passwords = OrderedDict()
 
 # JWT Bearer token scheme
 security = HTTPBearer()
@@ -67,21 +78,39 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+@lru_cache(maxsize=10000)
+def _decode_token(token: str) -> Tuple[str, Tuple[str, ...], Optional[int]]:
+    """
+    Decode and validate a JWT once per distinct token; returns the username,
+    permissions and exp timestamp. The cached value is shared by every
+    request presenting the token, so it is kept immutable. Failures raise
+    and are not cached.
+    """
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    username: str = payload.get("sub")
+    permissions: List[str] = payload.get("permissions", [])
+    
+    if username is None:
+        raise AuthenticationError()
+    
+    return username, tuple(permissions), payload.get("exp")
+
+
 def verify_token(token: str) -> TokenData:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        permissions: List[str] = payload.get("permissions", [])
-        
-        if username is None:
-            raise AuthenticationError()
-            
-        token_data = TokenData(username=username, permissions=permissions)
-        return token_data
+        username, permissions, expires_at = _decode_token(token)
     except JWTError as e:
         logger.warning(f"JWT verification failed: {e}")
         raise AuthenticationError()
+    
+    # Cached tokens skip jose's exp check, so repeat it here
+    if expires_at is not None and expires_at < time.time():
+        logger.warning("JWT verification failed: Signature has expired.")
+        raise AuthenticationError()
+    
+    # A fresh TokenData per request (the values were validated on decode)
+    return TokenData.model_construct(username=username, permissions=list(permissions))
 
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenData:
@@ -101,23 +130,31 @@ class PermissionChecker:
     
     def __init__(self, required_permissions: List[str]):
         self.required_permissions = required_permissions
+        self.required = frozenset(required_permissions)
     
     def __call__(self, current_user: TokenData = Depends(get_current_active_user)) -> TokenData:
-        for permission in self.required_permissions:
-            if permission not in current_user.permissions:
-                raise AuthorizationError(
-                    detail=f"Permission '{permission}' required"
-                )
+        missing = self.required.difference(current_user.permissions)
+        if missing:
+            # Report the first missing permission in declaration order
+            permission = next(p for p in self.required_permissions if p in missing)
+            raise AuthorizationError(
+                detail=f"Permission '{permission}' required"
+            )
         return current_user
 
 
 # Permission dependency factories
-def require_permissions(*permissions: str):
-    """Factory function to create permission dependency"""
-    return Depends(PermissionChecker(list(permissions)))
+@lru_cache(maxsize=None)
+def require_permissions(*permissions: str) -> PermissionChecker:
+    """
+    Factory function to create a permission dependency, used as
+    Depends(require_permissions("write")). Checkers are built once per
+    permission set and reused, so every route shares the same instance.
+    """
+    return PermissionChecker(list(permissions))
 
 
-# Common permission dependencies
+# Common permission dependencies (use as Depends(require_admin))
 require_admin = require_permissions("admin")
 require_read = require_permissions("read")
 require_write = require_permissions("write")
@@ -138,41 +175,54 @@ async def get_current_user_optional(
         return None
 
 
-# Rate limiting setup (in-memory for now, should use Redis in production)
-from collections import defaultdict
-import time
-
+# Rate limiting: fixed one-minute windows, counted in Redis when REDIS_URL
+# is set (shared by all workers) or in process memory otherwise
 class RateLimiter:
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: int = 60, bucket: str = "default"):
         self.requests_per_minute = requests_per_minute
-        self.requests = defaultdict(list)
+        self.bucket = bucket
+        self.redis = None
+        if settings.REDIS_URL:
+            from redis import asyncio as aioredis
+            self.redis = aioredis.from_url(settings.REDIS_URL)
+        # In-memory fallback: counts for the current window only
+        self._window = None
+        self._counts = {}
     
-    def is_allowed(self, key: str) -> bool:
-        now = time.time()
-        minute_ago = now - 60
+    async def is_allowed(self, key: str) -> bool:
+        window = int(time.time() // 60)
         
-        # Clean old requests
-        self.requests[key] = [req_time for req_time in self.requests[key] if req_time > minute_ago]
+        if self.redis is not None:
+            try:
+                redis_key = f"rl:{self.bucket}:{key}:{window}"
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    count, _ = await pipe.incr(redis_key).expire(redis_key, 65).execute()
+                return count <= self.requests_per_minute
+            except Exception as e:
+                # Fail open rather than rejecting all traffic when Redis is down
+                logger.warning(f"Rate limit check failed, allowing request: {e}")
+                return True
         
-        # Check if under limit
-        if len(self.requests[key]) >= self.requests_per_minute:
-            return False
+        # A new window makes every stored count stale, so drop them all
+        if window != self._window:
+            self._window = window
+            self._counts = {}
         
-        # Add current request
-        self.requests[key].append(now)
-        return True
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        return count <= self.requests_per_minute
 
 
 # Rate limiter instances
-rate_limiter = RateLimiter(requests_per_minute=60)
-strict_rate_limiter = RateLimiter(requests_per_minute=10)
+rate_limiter = RateLimiter(requests_per_minute=settings.RATE_LIMIT_PER_MINUTE, bucket="default")
+strict_rate_limiter = RateLimiter(requests_per_minute=settings.STRICT_RATE_LIMIT_PER_MINUTE, bucket="strict")
 
 
 async def check_rate_limit(request, call_next, limiter: RateLimiter = rate_limiter):
     """Rate limiting middleware"""
     client_ip = request.client.host
     
-    if not limiter.is_allowed(client_ip):
+    if not await limiter.is_allowed(client_ip):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded. Please try again later."
@@ -182,32 +232,55 @@ async def check_rate_limit(request, call_next, limiter: RateLimiter = rate_limit
     return response
 
 
-# Demo user for testing (in production, this would be in database)
+# Demo user for testing (in production, this would be in database).
+# Hashes are precomputed (bcrypt, 12 rounds) so importing this module
+# doesn't pay for two bcrypt hashes; passwords are admin123 / user123.
 DEMO_USERS = {
     "admin": {
         "username": "admin",
         "email": "admin@codebridge.com",
-        "hashed_password": get_password_hash("admin123"),
+        "hashed_password": "$2b$12$P3VXuoWQrlXF480wB9yswu5XkmoB6hzB3iNx6INhGHbqyWMn3dctW",
         "permissions": ["admin", "read", "write", "delete"],
         "is_active": True
     },
     "user": {
         "username": "user",
         "email": "user@codebridge.com", 
-        "hashed_password": get_password_hash("user123"),
+        "hashed_password": "$2b$12$HooerNrm379/ZPg9h6XH8OhDurydOeBT2a5hy9DloN8ypINZI.VQq",
         "permissions": ["read", "write"],
         "is_active": True
     }
 }
 
 
-def authenticate_user(username: str, password: str) -> Optional[dict]:
+async def verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password, reusing a successful check from the last
+    PASSWORD_CACHE_TTL_SECONDS. bcrypt runs in a worker thread so it
+    doesn't block the event loop.
+    """
+    key = (hashlib.sha256(plain_password.encode()).hexdigest(), hashed_password)
+    expires = _verified_passwords.get(key)
+    if expires is not None and time.monotonic() < expires:
+        return True
+    
+    if not await asyncio.to_thread(verify_password, plain_password, hashed_password):
+        return False
+    
+    _verified_passwords[key] = time.monotonic() + PASSWORD_CACHE_TTL_SECONDS
+    _verified_passwords.move_to_end(key)
+    if len(_verified_passwords) > PASSWORD_CACHE_MAX_ENTRIES:
+        _verified_passwords.popitem(last=False)
+    return True
+
+
+async def authenticate_user(username: str, password: str) -> Optional[dict]:
     """Authenticate user with username and password"""
     user = DEMO_USERS.get(username)
     if not user:
         return None
     
-    if not verify_password(password, user["hashed_password"]):
+    if not await verify_password_cached(password, user["hashed_password"]):
         return None
     
     return user
@@ -0,0 +1,89 @@
+"""
+Response caching for read-heavy endpoints (fastapi-cache2)
+"""
+
+from functools import wraps
+from typing import Callable, Optional
+import logging
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "cb"
+
+_cache_ready = False
+
+
+def init_cache():
+    """
+    Initialize the response cache: Redis when REDIS_URL is set,
+    otherwise a per-process in-memory store.
+    """
+    global _cache_ready
+    if settings.REDIS_URL:
+        from fastapi_cache.backends.redis import RedisBackend
+        from redis import asyncio as aioredis
+        backend = RedisBackend(aioredis.from_url(settings.REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix=CACHE_PREFIX, expire=settings.CACHE_EXPIRE_SECONDS)
+    _cache_ready = True
+    logger.info(f"Response cache initialized ({type(backend).__name__})")
+
+
+def request_key_builder(
+    func: Callable,
+    namespace: str = "",
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    """
+    Build a cache key from the request path and query string only, so the
+    key doesn't depend on the caller (token, session objects, etc.)
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{FastAPICache.get_prefix()}:{namespace}:{request.url.path}?{query}"
+
+
+def cached_response(namespace: str, expire: Optional[int] = None):
+    """
+    Cache a GET endpoint's response under namespace.
+
+    Keys are user-neutral; when CACHE_USER_NEUTRAL is off, requests from an
+    authenticated current_user bypass the cache. The cache is also bypassed
+    until init_cache() has run.
+    """
+    def decorator(func):
+        cached = cache(expire=expire, namespace=namespace, key_builder=request_key_builder)(func)
+
+        @wraps(cached)
+        async def wrapper(*args, **kwargs):
+            if not _cache_ready or (
+                not settings.CACHE_USER_NEUTRAL and kwargs.get("current_user") is not None
+            ):
+                kwargs.pop("request", None)
+                kwargs.pop("response", None)
+                return await func(*args, **kwargs)
+            return await cached(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_cache(namespace: str):
+    """Drop all cached responses in namespace"""
+    if not _cache_ready:
+        return
+    try:
+        await FastAPICache.clear(namespace=namespace)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for '{namespace}': {e}")
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     # Server Configuration
     HOST: str = "0.0.0.0"
     PORT: int = 3047
+    WORKERS: Optional[int] = None  # uvicorn worker processes; derived from CPUs and REDIS_URL if unset
     
     # CORS Configuration
     ALLOWED_HOSTS: List[str] = ["*"]
@@ -26,6 +27,16 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./codebridge.db"
     ASYNC_DATABASE_URL: str = "sqlite+aiosqlite:///./codebridge.db"
     DATABASE_ECHO: bool = False  # Set to True to log SQL queries
+    # Connection pool sizing, per engine; match to expected concurrency
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    
+    # Response Caching
+    REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0; in-memory cache if unset
+    CACHE_EXPIRE_SECONDS: int = 60
+    CACHE_USER_NEUTRAL: bool = True  # False: authenticated requests bypass the cache
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -33,6 +44,7 @@ class Settings(BaseSettings):
     
     # Security
     SECRET_KEY: str = "codebridge-jwt-secret-key-change-in-production-please"
+    BCRYPT_ROUNDS: int = 12  # Lower (e.g. 10) in development for faster logins
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
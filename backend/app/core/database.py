@@ -2,44 +2,126 @@
 Database configuration and connection management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, make_url, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, StaticPool
 import logging
+import sqlite3
+import orjson
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
-# Synchronous database engine with connection pooling
+# Pool settings shared by both engines (see DB_POOL_* in settings)
+_POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
+
+def json_serializer(value) -> str:
+    """Encode a JSON column value (topics/tags) with orjson; drivers expect str"""
+    return orjson.dumps(value).decode()
+
+
+def _engine_options(url: str, pool_class) -> dict:
+    """
+    Pooling for a database URL. An in-memory SQLite database exists only
+    inside its one connection, so every session must share it (StaticPool).
+    File-backed SQLite keeps a pool: under WAL its connections read
+    concurrently while one writes (check_same_thread is already off for
+    pooled file connections).
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return dict(poolclass=StaticPool, connect_args={"check_same_thread": False})
+    return dict(poolclass=pool_class, **_POOL_OPTIONS)
+
+
+# Synchronous database engine, used by the content API, table management
+# and migrations
 engine = create_engine(
     settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(settings.DATABASE_URL, QueuePool),
 )
 
-# Asynchronous database engine for async operations
+# Asynchronous database engine, used by the project API
 async_engine = create_async_engine(
     settings.ASYNC_DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
     echo=settings.DEBUG,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(settings.ASYNC_DATABASE_URL, AsyncAdaptedQueuePool),
 )
 
+
+# Per-connection SQLite tuning: WAL lets readers run alongside a writer,
+# synchronous=NORMAL is durable under WAL without an fsync per commit,
+# plus a 64MB page cache, in-memory temp tables and 256MB of mmap I/O
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=60000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to a new SQLite connection ("connect" event)"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """
+    SQLite only enforces foreign keys when asked to, per connection.
+    The API relies on the content.project_id constraint to reject content
+    for missing projects.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+# The services write with INSERT/UPDATE/DELETE ... RETURNING and
+# INSERT ... ON CONFLICT, which SQLite supports from 3.35
+SQLITE_MIN_VERSION = (3, 35, 0)
+
+for _engine in (engine, async_engine.sync_engine):
+    if _engine.dialect.name == "sqlite":
+        if sqlite3.sqlite_version_info < SQLITE_MIN_VERSION:
+            raise RuntimeError(
+                f"SQLite {'.'.join(map(str, SQLITE_MIN_VERSION))} or newer is required "
+                f"(found {sqlite3.sqlite_version})"
+            )
+        event.listen(_engine, "connect", set_sqlite_pragmas)
+        event.listen(_engine, "connect", _enable_sqlite_foreign_keys)
+
+# Connectivity probe, compiled once
+_PING = text("SELECT 1")
+
 # Session factories
+# Like the async factory, don't expire objects on commit: sessions are
+# request-scoped, and written objects (e.g. rows from INSERT ... RETURNING)
+# stay readable without a reload
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
-    class_=Session
+    class_=Session,
+    expire_on_commit=False
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -73,23 +155,35 @@ async def get_async_db() -> AsyncSession:
             await session.close()
 
 
-def create_tables():
+def create_tables(bind=None):
     """
     Create all tables in the database
-    Used for testing and initial setup
+    Used for testing and initial setup. Pass a connection as bind to run
+    inside the caller's transaction.
     """
     from app.models.database import Base
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=bind if bind is not None else engine)
     logger.info("Database tables created successfully")
 
 
-def drop_tables():
+def ensure_tables():
+    """
+    Create the tables only if any are missing; when they all exist this
+    costs one table-name query instead of a create_all() check per table
+    """
+    from app.models.database import Base
+    if not set(inspect(engine).get_table_names()).issuperset(Base.metadata.tables):
+        create_tables()
+
+
+def drop_tables(bind=None):
     """
     Drop all tables in the database
-    Used for testing and reset operations
+    Used for testing and reset operations. Pass a connection as bind to
+    run inside the caller's transaction.
     """
     from app.models.database import Base
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=bind if bind is not None else engine)
     logger.info("Database tables dropped successfully")
 
 
@@ -98,10 +192,10 @@ async def test_connection():
     Test database connectivity
     """
     try:
-        async with AsyncSessionLocal() as session:
-            result = await session.execute("SELECT 1")
-            row = result.fetchone()
-            if row and row[0] == 1:
+        # A bare connection is enough; no ORM session needed
+        async with async_engine.connect() as conn:
+            result = await conn.execute(_PING)
+            if result.scalar() == 1:
                 logger.info("✅ Database connection successful")
                 return True
             else:
@@ -130,10 +224,16 @@ def get_connection_info():
         return {
             "host": host,
             "database": database,
-            "pool_size": engine.pool.size(),
-            "checked_out_connections": engine.pool.checkedout(),
-            "overflow_connections": engine.pool.overflow(),
-            "invalid_connections": engine.pool.invalidated(),
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pools": {
+                name: {
+                    "idle_connections": pool.checkedin(),
+                    "checked_out_connections": pool.checkedout(),
+                    "overflow_connections": pool.overflow(),
+                } if isinstance(pool, QueuePool) else {"pool_class": type(pool).__name__}
+                for name, pool in (("sync", engine.pool), ("async", async_engine.pool))
+            },
         }
     except Exception as e:
         logger.error(f"Error getting connection info: {e}")
@@ -2,22 +2,58 @@
 Logging configuration with structured JSON logs
 """
 
+import atexit
 import logging
 import logging.config
-import json
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
+import orjson
+
 from .config import settings
 
+# Standard LogRecord attributes; anything else on a record came from extra={...}
+_RESERVED_RECORD_ATTRS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname",
+    "filename", "module", "lineno", "funcName", "created",
+    "msecs", "relativeCreated", "thread", "threadName",
+    "processName", "process", "getMessage", "stack_info",
+    "exc_info", "exc_text"
+})
+
+# Drains queued log records to the console off the request path
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    """Flush and stop the log listener thread (also run at exit)"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue records untouched; the listener is in-process, so there's no
+    need to pre-format them (which would flatten exc_info into the message)"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # record.created is already taken; orjson formats the datetime
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -27,22 +63,15 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add extra fields if present
-        if hasattr(record, "__dict__"):
-            for key, value in record.__dict__.items():
-                if key not in [
-                    "name", "msg", "args", "levelname", "levelno", "pathname",
-                    "filename", "module", "lineno", "funcName", "created",
-                    "msecs", "relativeCreated", "thread", "threadName",
-                    "processName", "process", "getMessage", "stack_info",
-                    "exc_info", "exc_text"
-                ]:
-                    log_entry[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS:
+                log_entry[key] = value
         
         # Add exception info if present
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_entry, default=str)
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS).decode()
 
 
 def setup_logging():
@@ -59,10 +88,18 @@ def setup_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     
+    # Loggers only enqueue records; a listener thread formats and writes
+    # them, so request handlers never block on stdout
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _queue_listener.start()
+    
     # Root logger configuration
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL.upper()),
-        handlers=[console_handler],
+        handlers=[_LocalQueueHandler(log_queue)],
         force=True
     )
     
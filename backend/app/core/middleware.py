@@ -0,0 +1,177 @@
+"""
+Pure ASGI middleware
+"""
+
+import logging
+
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .auth import RateLimiter
+from .responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+# Paths that are never rate limited (welcome page and docs)
+RATE_LIMIT_EXEMPT_PATHS = frozenset({"/", "/docs", "/redoc", "/openapi.json"})
+
+# CORS methods and request headers the API actually uses
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_ALLOW_HEADERS = (
+    "Accept", "Accept-Language", "Authorization", "Cache-Control",
+    "Content-Language", "Content-Type", "If-None-Match", "X-Requested-With",
+)
+
+
+class RateLimitMiddleware:
+    """
+    Reject clients over their rate limit with 429, keyed by client IP.
+    Works on the raw ASGI scope, so allowed requests pass straight through
+    without building Request/Response objects.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, exempt_paths=RATE_LIMIT_EXEMPT_PATHS):
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
+        try:
+            allowed = await self.limiter.is_allowed(client_ip)
+        except Exception as e:
+            logger.error(f"Rate limiting middleware error: {e}")
+            allowed = True
+
+        if not allowed:
+            response = ORJSONResponse(
+                {"detail": "Rate limit exceeded. Please try again later."},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _with_cors_headers(headers, cors_headers):
+    """
+    Response headers with cors_headers set the way Starlette sets them:
+    they replace same-named headers from the app, except Vary, which gets
+    the new value appended to the app's
+    """
+    cors_names = {name for name, _ in cors_headers}
+    merged = []
+    vary = None
+    for name, value in headers:
+        key = name.lower()
+        if key in cors_names:
+            if key == b"vary" and vary is None:
+                vary = value
+            continue
+        merged.append((name, value))
+    for name, value in cors_headers:
+        if name == b"vary" and vary is not None:
+            value = vary + b", " + value
+        merged.append((name, value))
+    return merged
+
+
+class WildcardCORSMiddleware:
+    """
+    CORS for ALLOWED_HOSTS=["*"]: every origin is allowed, so there are no
+    origin rules to evaluate and all headers are built once up front.
+    Mirrors Starlette's CORSMiddleware with allow_credentials=True: the
+    origin is echoed on preflights and cookie requests, "*" otherwise, and
+    every response allows credentials. CORS headers replace any the app
+    set, and Origin is added to its Vary header. Preflights asking for a
+    method or header outside allow_methods / allow_headers get a 400, as
+    Starlette answers them.
+    """
+
+    def __init__(self, app: ASGIApp, allow_methods=CORS_ALLOW_METHODS,
+                 allow_headers=CORS_ALLOW_HEADERS, max_age: int = 600):
+        self.app = app
+        # Raw header values are compared as bytes; header names case-insensitively
+        self.allow_methods = frozenset(method.encode() for method in allow_methods)
+        self.allow_headers = frozenset(header.lower().encode() for header in allow_headers)
+        self.preflight_headers = [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode()),
+            (b"access-control-allow-headers", ", ".join(allow_headers).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+        self.wildcard_headers = [(b"access-control-allow-origin", b"*"), (b"access-control-allow-credentials", b"true")]
+        self.credentialed_headers = [(b"access-control-allow-credentials", b"true"), (b"vary", b"Origin")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = has_cookie = requested_method = requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if requested_method is not None and scope["method"] == "OPTIONS":
+            await self.preflight_response(origin, requested_method, requested_headers, send)
+            return
+
+        if has_cookie:
+            cors_headers = [(b"access-control-allow-origin", origin), *self.credentialed_headers]
+        else:
+            cors_headers = self.wildcard_headers
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = _with_cors_headers(message.get("headers", ()), cors_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight_response(self, origin: bytes, requested_method: bytes,
+                                 requested_headers, send: Send):
+        """Answer a preflight: 200, or 400 naming the disallowed method/headers"""
+        failures = []
+        if requested_method not in self.allow_methods:
+            failures.append("method")
+        if requested_headers is not None and any(
+            header.strip() not in self.allow_headers for header in requested_headers.lower().split(b",")
+        ):
+            failures.append("headers")
+
+        if failures:
+            status_code = status.HTTP_400_BAD_REQUEST
+            body = ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status_code, body = status.HTTP_200_OK, b"OK"
+
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"access-control-allow-origin", origin),
+                *self.preflight_headers,
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,44 @@
+"""
+Custom response classes
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import msgspec
+import orjson
+from fastapi.responses import JSONResponse
+
+
+# Encoder is reusable; msgspec compiles per-Struct encoders on first use
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response encoded with msgspec.
+    Return msgspec.Struct instances (see models.schemas) from hot endpoints
+    to skip Pydantic validation and serialization of the payload.
+    A JSONResponse, so the response cache stores its rendered body.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson has no native support for the way Pydantic does"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson; the app's default response class.
+    datetimes are formatted natively in C (same ISO format as isoformat()),
+    so endpoints can return them as-is.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
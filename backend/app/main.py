@@ -2,18 +2,25 @@
 FastAPI Application Main Entry Point
 """
 
-from fastapi import FastAPI, Request, HTTPException, status
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
 import json
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from .core.config import settings
 from .core.logging_config import setup_logging
-from .core.auth import check_rate_limit, rate_limiter
-from .api.health import router as health_router
+from .core.auth import rate_limiter
+from .core.middleware import (
+    RateLimitMiddleware, WildcardCORSMiddleware, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS
+)
+from .core.cache import init_cache
+from .core.responses import ORJSONResponse
+from .api.health import router as health_router, sample_performance_info
 from .api.projects import router as projects_router
 from .api.content import router as content_router
 from .api.auth import router as auth_router
@@ -22,6 +29,16 @@ from .api.auth import router as auth_router
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up shared resources and run background tasks for the lifetime of the application"""
+    init_cache()
+    performance_sampler = asyncio.create_task(sample_performance_info())
+    yield
+    performance_sampler.cancel()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="CodeBridge API",
@@ -55,78 +72,56 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/docs" if settings.DEBUG else "/docs",  # Always show docs for now
     redoc_url="/redoc" if settings.DEBUG else "/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_HOSTS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if settings.ALLOWED_HOSTS == ["*"]:
+    app.add_middleware(WildcardCORSMiddleware)
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.ALLOWED_HOSTS,
+        allow_credentials=True,
+        allow_methods=list(CORS_ALLOW_METHODS),
+        allow_headers=list(CORS_ALLOW_HEADERS),
+    )
 
 # Rate limiting middleware
-@app.middleware("http")
-async def rate_limiting_middleware(request: Request, call_next):
-    """Apply rate limiting to all requests"""
-    try:
-        # Skip rate limiting for health checks and docs
-        if request.url.path in ["/", "/docs", "/redoc", "/openapi.json"]:
-            response = await call_next(request)
-            return response
-        
-        # Apply rate limiting
-        client_ip = request.client.host
-        if not rate_limiter.is_allowed(client_ip):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded. Please try again later."
-            )
-        
-        response = await call_next(request)
-        return response
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Rate limiting middleware error: {e}")
-        response = await call_next(request)
-        return response
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
 
 # Error handling middleware
 @app.middleware("http")
 async def error_handling_middleware(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         response = await call_next(request)
         
-        # Log successful requests
-        process_time = time.time() - start_time
-        logger.info(
-            "Request completed",
-            extra={
-                "method": request.method,
-                "url": str(request.url),
-                "status_code": response.status_code,
-                "process_time": round(process_time, 4),
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-        )
+        # Log successful requests (the formatter stamps the time)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request completed",
+                extra={
+                    "method": request.method,
+                    "path": request.scope["path"],
+                    "status_code": response.status_code,
+                    "process_time": round(time.perf_counter() - start_time, 4),
+                }
+            )
         
         return response
         
     except Exception as exc:
-        process_time = time.time() - start_time
         logger.error(
             "Request failed",
             extra={
                 "method": request.method,
-                "url": str(request.url),
+                "path": request.scope["path"],
                 "error": str(exc),
                 "error_type": type(exc).__name__,
-                "process_time": round(process_time, 4),
-                "timestamp": datetime.utcnow().isoformat(),
+                "process_time": round(time.perf_counter() - start_time, 4),
             },
             exc_info=True
         )
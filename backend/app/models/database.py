@@ -3,15 +3,22 @@ Database models for CodeBridge platform
 Based on the schema defined in you.md Step 2
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, DECIMAL, ForeignKey, Index, JSON, DDL, event
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from datetime import datetime
-import json
+
+from .schemas import ProjectStatus, ContentStatus
 
 Base = declarative_base()
 
+# List-of-strings column (topics/tags): JSONB on PostgreSQL, JSON elsewhere.
+# The driver encodes and decodes it, so the attribute is a plain list.
+JSONArray = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Project(Base):
     """
@@ -19,34 +26,36 @@ class Project(Base):
     Maps to: CREATE TABLE projects in you.md
     """
     __tablename__ = "projects"
+    __table_args__ = (
+        # list_projects filter combinations (migration 006): equality columns
+        # first, then id so filtered pages come back in id order (and cursor
+        # seeks on id > n) straight from the index, without a sort
+        Index("ix_projects_platform_status", "platform", "status", "id"),
+        Index("ix_projects_language_status", "language", "status", "id"),
+        # Element lookups on topics (@>), migration 004
+        Index("ix_projects_topics_gin", "topics", postgresql_using="gin",
+              postgresql_ops={"topics": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    platform = Column(String(50), nullable=False, index=True)
+    platform = Column(String(50), nullable=False)
     url = Column(Text, unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text)
     stars = Column(Integer, default=0)
-    language = Column(String(50), index=True)
-    topics = Column(Text, default="[]")  # JSON string for SQLite compatibility
+    language = Column(String(50))
+    topics = Column(JSONArray, default=list)
     quality_score = Column(DECIMAL(3, 2))
-    scraped_at = Column(DateTime, default=func.now())
-    status = Column(String(20), default='discovered', index=True)
+    scraped_at = Column(DateTime, server_default=func.now(), nullable=False)
+    status = Column(SAEnum(ProjectStatus, name='project_status', native_enum=True, create_constraint=True),
+                    default=ProjectStatus.discovered, nullable=False, index=True)
     
     # Relationships
-    content_items = relationship("Content", back_populates="project", cascade="all, delete-orphan")
-    
-    @property
-    def topics_list(self):
-        """Convert topics JSON string to list"""
-        try:
-            return json.loads(self.topics) if self.topics else []
-        except (json.JSONDecodeError, TypeError):
-            return []
-    
-    @topics_list.setter
-    def topics_list(self, value):
-        """Convert topics list to JSON string"""
-        self.topics = json.dumps(value if value else [])
+    # topics is a plain column, so list queries never touch a child table;
+    # relationships refuse to lazy-load so an N+1 can't sneak in - load them
+    # explicitly with selectinload() when needed
+    content_items = relationship("Content", back_populates="project", cascade="all, delete-orphan",
+                                 lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}', platform='{self.platform}')>"
@@ -58,38 +67,63 @@ class Content(Base):
     Maps to: CREATE TABLE content in you.md
     """
     __tablename__ = "content"
+    __table_args__ = (
+        # Compound indexes for list_content filter combinations (migration 002)
+        Index("ix_content_project_status_type", "project_id", "status", "content_type"),
+        Index("ix_content_status_type", "status", "content_type"),
+        # Element lookups on tags (@>), migration 004
+        Index("ix_content_tags_gin", "tags", postgresql_using="gin",
+              postgresql_ops={"tags": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     content_type = Column(String(50), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     slug = Column(String(255), unique=True, nullable=False, index=True)
-    raw_content = Column(Text, nullable=False)
-    enhanced_content = Column(Text)
+    # Large bodies are left out of entity loads unless undeferred
+    # (see CONTENT_TEXT_FIELDS in the database service)
+    raw_content = deferred(Column(Text, nullable=False))
+    enhanced_content = deferred(Column(Text))
     meta_description = Column(String(160))
-    tags = Column(Text, default="[]")  # JSON string for SQLite compatibility
-    status = Column(String(20), default='draft', index=True)
-    created_at = Column(DateTime, default=func.now())
+    tags = Column(JSONArray, default=list)
+    status = Column(SAEnum(ContentStatus, name='content_status', native_enum=True, create_constraint=True),
+                    default=ContentStatus.draft, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
-    project = relationship("Project", back_populates="content_items")
-    
-    @property
-    def tags_list(self):
-        """Convert tags JSON string to list"""
-        try:
-            return json.loads(self.tags) if self.tags else []
-        except (json.JSONDecodeError, TypeError):
-            return []
-    
-    @tags_list.setter
-    def tags_list(self, value):
-        """Convert tags list to JSON string"""
-        self.tags = json.dumps(value if value else [])
+    project = relationship("Project", back_populates="content_items", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Content(id={self.id}, title='{self.title}', status='{self.status}')>"
 
 
+def json_array_fts_ddl(table: str, column: str):
+    """
+    SQLite DDL making a JSON array column (topics/tags) searchable by
+    element: an FTS5 index <table>_<column>_fts over the stored JSON text,
+    kept in sync by triggers. PostgreSQL uses the GIN indexes declared on
+    the models instead.
+    """
+    fts = f"{table}_{column}_fts"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column}, content='{table}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+# Keep create_all() in step with migrations 003/004
+for _model, _column in ((Project, "topics"), (Content, "tags")):
+    for _statement in json_array_fts_ddl(_model.__tablename__, _column):
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+
 # Export all models for easy importing
 __all__ = ["Base", "Project", "Content"]
@@ -2,10 +2,23 @@
 Pydantic Models for Request/Response Validation
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
+import re
+import msgspec
+
+
+# Validator constants, built once at import
+_SLUG_RE = re.compile(r'^[a-z0-9-]+$')
+_PLATFORMS = ('github', 'huggingface', 'gitlab', 'kaggle', 'bitbucket')
+_ALLOWED_PLATFORMS = frozenset(_PLATFORMS)
+_PLATFORM_ERROR = f'Platform must be one of: {", ".join(_PLATFORMS)}'
+_CONTENT_TYPES = ('blog', 'article', 'tutorial', 'guide', 'review')
+_ALLOWED_CONTENT_TYPES = frozenset(_CONTENT_TYPES)
+_CONTENT_TYPE_ERROR = f'Content type must be one of: {", ".join(_CONTENT_TYPES)}'
 
 
 class ProjectStatus(str, Enum):
@@ -34,18 +47,20 @@ class ProjectBase(BaseModel):
     quality_score: Optional[float] = Field(None, ge=0.0, le=10.0, description="Quality score (0-10)")
     status: ProjectStatus = Field(ProjectStatus.discovered, description="Project processing status")
 
-    @validator('url')
+    @field_validator('url')
+    @classmethod
     def validate_url(cls, v):
         if not v.startswith(('http://', 'https://')):
             raise ValueError('URL must start with http:// or https://')
         return v
 
-    @validator('platform')
+    @field_validator('platform')
+    @classmethod
     def validate_platform(cls, v):
-        allowed_platforms = ['github', 'huggingface', 'gitlab', 'kaggle', 'bitbucket']
-        if v.lower() not in allowed_platforms:
-            raise ValueError(f'Platform must be one of: {", ".join(allowed_platforms)}')
-        return v.lower()
+        v = v.lower()
+        if v not in _ALLOWED_PLATFORMS:
+            raise ValueError(_PLATFORM_ERROR)
+        return v
 
 
 class ProjectCreate(ProjectBase):
@@ -63,13 +78,20 @@ class ProjectUpdate(BaseModel):
     quality_score: Optional[float] = Field(None, ge=0.0, le=10.0)
     status: Optional[ProjectStatus] = None
 
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v):
+        # Omitting status leaves it unchanged; an explicit null is not a status
+        if v is None:
+            raise ValueError('Status cannot be null')
+        return v
+
 
 class Project(ProjectBase):
     id: int
     scraped_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContentBase(BaseModel):
@@ -83,19 +105,20 @@ class ContentBase(BaseModel):
     tags: Optional[List[str]] = Field(default_factory=list, description="Content tags")
     status: ContentStatus = Field(ContentStatus.draft, description="Content status")
 
-    @validator('slug')
+    @field_validator('slug')
+    @classmethod
     def validate_slug(cls, v):
-        import re
-        if not re.match(r'^[a-z0-9-]+$', v):
+        if not _SLUG_RE.match(v):
             raise ValueError('Slug must contain only lowercase letters, numbers, and hyphens')
         return v
 
-    @validator('content_type')
+    @field_validator('content_type')
+    @classmethod
     def validate_content_type(cls, v):
-        allowed_types = ['blog', 'article', 'tutorial', 'guide', 'review']
-        if v.lower() not in allowed_types:
-            raise ValueError(f'Content type must be one of: {", ".join(allowed_types)}')
-        return v.lower()
+        v = v.lower()
+        if v not in _ALLOWED_CONTENT_TYPES:
+            raise ValueError(_CONTENT_TYPE_ERROR)
+        return v
 
 
 class ContentCreate(ContentBase):
@@ -113,13 +136,20 @@ class ContentUpdate(BaseModel):
     tags: Optional[List[str]] = None
     status: Optional[ContentStatus] = None
 
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v):
+        # Omitting status leaves it unchanged; an explicit null is not a status
+        if v is None:
+            raise ValueError('Status cannot be null')
+        return v
+
 
 class Content(ContentBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # API Response Models
@@ -133,12 +163,68 @@ class PaginatedResponse(BaseModel):
     success: bool
     message: str
     data: List[dict]
+    # page is None when paginating by cursor; total and pages are only
+    # counted on offset pages, so cursor pages leave them None too
+    total: Optional[int]
+    page: Optional[int]
+    per_page: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+# msgspec response structs for hot list endpoints, encoded directly by
+# core.responses.MsgspecJSONResponse. Field layout mirrors PaginatedResponse.
+class ContentRow(msgspec.Struct):
+    id: int
+    project_id: int
+    content_type: str
+    title: str
+    slug: str
+    meta_description: Optional[str]
+    tags: Optional[List[str]]
+    status: Optional[str]
+    created_at: Optional[datetime]
+    raw_content_length: int
+    enhanced_content_length: int
+
+
+class PaginatedContentResponse(msgspec.Struct):
+    success: bool
+    message: str
+    data: List[ContentRow]
     total: int
     page: int
     per_page: int
     pages: int
 
 
+# Rows come from our own database, so there is nothing to validate; gc=False
+# since they only hold scalars and a list of strings (no reference cycles)
+class ProjectRow(msgspec.Struct, gc=False):
+    id: int
+    platform: str
+    url: str
+    name: str
+    description: Optional[str]
+    stars: Optional[int]
+    language: Optional[str]
+    topics: Optional[List[str]]
+    quality_score: Optional[Decimal]
+    status: str
+    scraped_at: Optional[datetime]
+
+
+class PaginatedProjectResponse(msgspec.Struct):
+    success: bool
+    message: str
+    data: List[ProjectRow]
+    total: Optional[int]
+    page: Optional[int]
+    per_page: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
+
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -174,5 +260,4 @@ class User(UserBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
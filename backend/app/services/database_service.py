@@ -2,142 +2,384 @@
 Database service functions for CRUD operations
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete
-from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, selectinload, undefer
+from sqlalchemy import (
+    select, insert, update, delete, func, lambda_stmt, table, false, literal, literal_column, cast, Text, bindparam
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+from functools import lru_cache
+import base64
+import binascii
 import logging
+import re
 
 from app.models.database import Project, Content
-from app.models.schemas import ProjectCreate, ProjectUpdate, ContentCreate, ContentUpdate
-from app.core.database import get_db
+from app.models.schemas import (
+    ProjectCreate, ContentCreate, ContentUpdate, ProjectStatus, ContentStatus
+)
+from app.core.database import get_db, engine, json_serializer
 
 logger = logging.getLogger(__name__)
 
 
-# Project CRUD operations
-def create_project(db: Session, project: ProjectCreate) -> Project:
-    """Create a new project"""
+def _json_array_contains(model, column, value: str):
+    """
+    Condition for "JSON array column contains value". PostgreSQL tests
+    JSONB containment (@>), served by the column's GIN index; SQLite uses
+    the <table>_<column>_fts FTS5 index to narrow candidates before an
+    exact match on the stored JSON text.
+    """
+    if engine.dialect.name == "postgresql":
+        return column.op("@>")(func.jsonb_build_array(cast(value, Text)))
+    
+    # Match the element exactly as the engine's JSON serializer writes it
+    encoded = json_serializer(value)
+    condition = cast(column, Text).contains(encoded, autoescape=True)
+    
+    if engine.dialect.name == "sqlite" and re.search(r"\w", encoded):
+        fts = f"{model.__tablename__}_{column.key}_fts"
+        phrase = '"' + encoded[1:-1].replace('"', '""') + '"'
+        matches = select(literal_column("rowid")).select_from(table(fts)).where(
+            literal_column(fts).op("MATCH")(phrase)
+        )
+        condition = model.id.in_(matches) & condition
+    
+    return condition
+
+
+def _status_equals(column, status_enum, value: str):
+    """
+    Condition for "status column equals value". Values outside the enum
+    match nothing (a native ENUM column would reject them as input).
+    """
     try:
-        # Convert to dict and handle topics
-        project_data = project.dict()
-        if 'topics' in project_data and isinstance(project_data['topics'], list):
-            topics_list = project_data.pop('topics')
-            db_project = Project(**project_data)
-            db_project.topics_list = topics_list
-        else:
-            db_project = Project(**project_data)
-        
-        db.add(db_project)
+        return column == status_enum(value)
+    except ValueError:
+        return false()
+
+
+def _dialect_insert(dialect):
+    """insert() construct with ON CONFLICT support for the dialect (PostgreSQL, else SQLite)"""
+    return postgresql.insert if dialect.name == "postgresql" else sqlite.insert
+
+
+# Single-row lookups built once, with the values bound per call: a prebuilt
+# statement memoizes its cache key, so repeat calls go straight to the
+# cached compiled SQL without rebuilding the select()
+_PROJECT_EXISTS = select(literal(True)).where(Project.id == bindparam("project_id")).limit(1)
+_PROJECT_URL_EXISTS = select(literal(True)).where(Project.url == bindparam("url")).limit(1)
+_PROJECT_BY_URL = select(Project).where(Project.url == bindparam("url")).limit(1)
+_CONTENT_EXISTS = select(literal(True)).where(Content.id == bindparam("content_id")).limit(1)
+_CONTENT_BY_SLUG = select(Content).where(Content.slug == bindparam("slug")).limit(1)
+
+
+def _end_write(db: Session, commit: bool):
+    """
+    Commit a service write, or with commit=False only flush it so several
+    writes share the caller's transaction (the caller commits)
+    """
+    if commit:
         db.commit()
-        db.refresh(db_project)
-        logger.info(f"Created project: {db_project.name} (ID: {db_project.id})")
+    else:
+        db.flush()
+
+
+async def _end_write_async(db: AsyncSession, commit: bool):
+    """_end_write for an AsyncSession"""
+    if commit:
+        await db.commit()
+    else:
+        await db.flush()
+
+
+# Project CRUD operations (async; the project API runs on the async engine)
+# Writes commit unless called with commit=False (see _end_write)
+async def create_project(db: AsyncSession, project: ProjectCreate, commit: bool = True) -> Optional[Project]:
+    """Create a new project. Returns None if a project with its URL already exists."""
+    try:
+        # The request model is already validated, so dump it straight to
+        # column values
+        values = {**project.model_dump(exclude={'topics'}), 'topics': project.topics or []}
+        
+        # One statement: ON CONFLICT skips a duplicate URL (no pre-check
+        # SELECT) and RETURNING hands back the generated id/defaults
+        # instead of a refresh SELECT after the commit
+        stmt = (
+            _dialect_insert(db.bind.dialect)(Project).values(**values)
+            .on_conflict_do_nothing(index_elements=['url'])
+            .returning(Project)
+        )
+        db_project = (await db.execute(stmt)).scalar_one_or_none()
+        await _end_write_async(db, commit)
+        if db_project is None:
+            return None
+        logger.info("Created project: %s (ID: %d)", db_project.name, db_project.id)
         return db_project
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error creating project: {e}")
         raise
 
 
-def get_project(db: Session, project_id: int) -> Optional[Project]:
+async def get_project(db: AsyncSession, project_id: int) -> Optional[Project]:
     """Get a project by ID"""
     try:
-        return db.query(Project).filter(Project.id == project_id).first()
+        return await db.get(Project, project_id)
     except Exception as e:
         logger.error(f"Error getting project {project_id}: {e}")
         raise
 
 
-def get_project_by_url(db: Session, url: str) -> Optional[Project]:
+async def project_exists(db: AsyncSession, project_id: int) -> bool:
+    """Check a project exists without loading the row"""
+    try:
+        result = await db.execute(_PROJECT_EXISTS, {"project_id": project_id})
+        return result.scalar() is not None
+    except Exception as e:
+        logger.error(f"Error checking project {project_id} exists: {e}")
+        raise
+
+
+async def project_url_exists(db: AsyncSession, url: str) -> bool:
+    """Check a project with this URL exists without loading the row"""
+    try:
+        result = await db.execute(_PROJECT_URL_EXISTS, {"url": url})
+        return result.scalar() is not None
+    except Exception as e:
+        logger.error(f"Error checking project URL {url} exists: {e}")
+        raise
+
+
+async def get_project_by_url(db: AsyncSession, url: str) -> Optional[Project]:
     """Get a project by URL"""
     try:
-        return db.query(Project).filter(Project.url == url).first()
+        result = await db.execute(_PROJECT_BY_URL, {"url": url})
+        return result.scalars().first()
     except Exception as e:
         logger.error(f"Error getting project by URL {url}: {e}")
         raise
 
 
-def get_projects(db: Session, skip: int = 0, limit: int = 100, filters: Dict[str, Any] = None) -> List[Project]:
-    """Get projects with optional filtering"""
+def _filter_projects(stmt, filters: Dict[str, Any] = None):
+    """
+    Apply the supported project list filters to a lambda_stmt.
+
+    Each criterion is its own lambda; SQLAlchemy caches the SQL built for a
+    given chain of lambdas and turns their closure values into bound
+    parameters, so repeat calls with the same filter keys skip statement
+    construction and compilation. Closure values must be plain values or
+    prebuilt SQL expressions (no Python logic on them inside the lambda).
+    """
+    if filters:
+        if 'platform' in filters:
+            platform = filters['platform']
+            stmt += lambda s: s.where(Project.platform == platform)
+        if 'status' in filters:
+            status_condition = _status_equals(Project.status, ProjectStatus, filters['status'])
+            stmt += lambda s: s.where(status_condition)
+        if 'language' in filters:
+            language = filters['language']
+            stmt += lambda s: s.where(Project.language == language)
+        if 'topic' in filters:
+            topic_condition = _json_array_contains(Project, Project.topics, filters['topic'])
+            stmt += lambda s: s.where(topic_condition)
+    return stmt
+
+
+def _select_projects(columns=None, include_content: bool = False):
+    """Base lambda_stmt for a project list: the given columns, or Project entities"""
+    if columns:
+        return lambda_stmt(lambda: select(*columns))
+    if include_content:
+        return lambda_stmt(lambda: select(Project).options(selectinload(Project.content_items)))
+    return lambda_stmt(lambda: select(Project))
+
+
+async def _fetch_projects(db: AsyncSession, stmt, columns=None) -> List[Any]:
+    """Run a project select, returning Row tuples if columns were selected, else entities"""
+    result = await db.execute(stmt)
+    return result.all() if columns else result.scalars().all()
+
+
+async def get_projects(db: AsyncSession, skip: int = 0, limit: int = 100, filters: Dict[str, Any] = None,
+                       columns=None, include_content: bool = False) -> List[Project]:
+    """
+    Get projects with optional filtering.
+    Pass columns to get lightweight Row tuples of just those columns
+    instead of full Project entities, or include_content to load each
+    project's content_items with one extra IN query for the whole page.
+    """
     try:
-        query = db.query(Project)
-        
-        if filters:
-            if 'platform' in filters:
-                query = query.filter(Project.platform == filters['platform'])
-            if 'status' in filters:
-                query = query.filter(Project.status == filters['status'])
-            if 'language' in filters:
-                query = query.filter(Project.language == filters['language'])
-        
-        return query.offset(skip).limit(limit).all()
+        stmt = _filter_projects(_select_projects(columns, include_content), filters)
+        stmt += lambda s: s.order_by(Project.id).offset(skip).limit(limit)
+        return await _fetch_projects(db, stmt, columns)
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
         raise
 
 
-def update_project(db: Session, project_id: int, project_update: ProjectUpdate) -> Optional[Project]:
-    """Update a project"""
+def encode_cursor(last_id: int) -> str:
+    """Encode the last seen row ID as an opaque pagination cursor"""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a pagination cursor; raises ValueError if it is malformed"""
     try:
-        db_project = db.query(Project).filter(Project.id == project_id).first()
-        if not db_project:
-            return None
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def cursor_get_projects(db: AsyncSession, cursor: Optional[str] = None, per_page: int = 100,
+                              filters: Dict[str, Any] = None, columns=None) -> Tuple[List[Project], Optional[str]]:
+    """
+    Get the page of projects after cursor using keyset pagination (an index
+    seek on id instead of an OFFSET scan). Returns (projects, next_cursor);
+    next_cursor is None on the last page. columns works as in get_projects
+    and must include Project.id.
+    """
+    try:
+        stmt = _filter_projects(_select_projects(columns), filters)
+        if cursor:
+            last_id = decode_cursor(cursor)
+            stmt += lambda s: s.where(Project.id > last_id)
         
-        update_data = project_update.dict(exclude_unset=True)
+        page_size = per_page + 1
+        stmt += lambda s: s.order_by(Project.id).limit(page_size)
+        projects = await _fetch_projects(db, stmt, columns)
+        if len(projects) > per_page:
+            return projects[:per_page], encode_cursor(projects[per_page - 1].id)
+        return projects, None
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting projects after cursor {cursor}: {e}")
+        raise
+
+
+async def count_projects(db: AsyncSession, filters: Dict[str, Any] = None) -> int:
+    """Count projects matching the filters with a single COUNT(*) query"""
+    try:
+        stmt = _filter_projects(lambda_stmt(lambda: select(func.count(Project.id))), filters)
+        return (await db.execute(stmt)).scalar()
+    except Exception as e:
+        logger.error(f"Error counting projects: {e}")
+        raise
+
+
+def _insert_rows(db: Session, model, rows: List[Dict[str, Any]], unique_column: str,
+                 commit: bool = True, returning: Sequence[Any] = ()) -> Union[int, List[Any]]:
+    """
+    Insert row dicts in one executemany INSERT (batched by SQLAlchemy's
+    insertmanyvalues) and commit once, unless commit is False (the caller
+    commits). Rows whose unique_column value already exists are skipped.
+    Returns the number inserted, or with returning (columns) the inserted
+    rows' values for them.
+    """
+    # Core insert on the table (not the ORM entity) so rowcount is reported
+    stmt = _dialect_insert(db.bind.dialect)(model.__table__).on_conflict_do_nothing(index_elements=[unique_column])
+    if returning:
+        stmt = stmt.returning(*returning)
+    result = db.execute(stmt, rows)
+    inserted = result.all() if returning else result.rowcount
+    if commit:
+        db.commit()
+    return inserted
+
+
+def bulk_create_projects(db: Session, items: List[Dict[str, Any]], commit: bool = True) -> int:
+    """
+    Create many projects from plain dicts (ProjectCreate fields) in one
+    transaction, without per-row refreshes. Projects whose URL already
+    exists are skipped. Pass commit=False to leave the transaction open
+    for the caller. Returns the number inserted.
+    """
+    if not items:
+        return 0
+    
+    try:
+        rows = [{**item, 'topics': item.get('topics') or []} for item in items]
+        inserted = _insert_rows(db, Project, rows, 'url', commit=commit)
+        logger.info("Bulk created %d of %d projects", inserted, len(rows))
+        return inserted
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error bulk creating projects: {e}")
+        raise
+
+
+async def update_project(db: AsyncSession, project_id: int, changes: Dict[str, Any],
+                         commit: bool = True) -> Optional[Any]:
+    """
+    Update a project in a single UPDATE ... RETURNING statement.
+    changes is the set fields of a ProjectUpdate (model_dump(exclude_unset=True)).
+    Returns the updated (id, name, status) row, or None if there is no
+    such project.
+    """
+    try:
+        update_data = changes
         
-        # Handle topics update
+        # topics may be sent as null; store an empty list (don't alter the caller's dict)
         if 'topics' in update_data:
-            topics_list = update_data.pop('topics')
-            db_project.topics_list = topics_list
+            update_data = {**changes, 'topics': changes['topics'] or []}
         
-        for field, value in update_data.items():
-            setattr(db_project, field, value)
+        summary_columns = (Project.id, Project.name, Project.status)
+        if update_data:
+            stmt = update(Project).where(Project.id == project_id).values(**update_data).returning(*summary_columns)
+        else:
+            stmt = select(*summary_columns).where(Project.id == project_id)
         
-        db.commit()
-        db.refresh(db_project)
-        logger.info(f"Updated project: {db_project.name} (ID: {project_id})")
-        return db_project
+        updated = (await db.execute(stmt)).first()
+        await _end_write_async(db, commit)
+        if updated is not None:
+            logger.info("Updated project: %s (ID: %d)", updated.name, project_id)
+        return updated
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error updating project {project_id}: {e}")
         raise
 
 
-def delete_project(db: Session, project_id: int) -> bool:
-    """Delete a project"""
+async def delete_project(db: AsyncSession, project_id: int, commit: bool = True) -> Optional[str]:
+    """
+    Delete a project and its content.
+    Returns the deleted project's name, or None if there is no such project.
+    """
     try:
-        db_project = db.query(Project).filter(Project.id == project_id).first()
-        if not db_project:
-            return False
-        
-        # Delete associated content first
-        db.query(Content).filter(Content.project_id == project_id).delete()
+        # Delete associated content first; bulk deletes avoid loading
+        # the content_items relationship (no lazy loads under asyncio)
+        await db.execute(delete(Content).where(Content.project_id == project_id))
+        result = await db.execute(delete(Project).where(Project.id == project_id).returning(Project.name))
+        project_name = result.scalar()
+        if project_name is None:
+            # Nothing was deleted; leave a caller's open transaction alone
+            if commit:
+                await db.rollback()
+            return None
         
-        db.delete(db_project)
-        db.commit()
-        logger.info(f"Deleted project ID: {project_id}")
-        return True
+        await _end_write_async(db, commit)
+        logger.info("Deleted project ID: %d", project_id)
+        return project_name
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error deleting project {project_id}: {e}")
         raise
 
 
 # Content CRUD operations
-def create_content(db: Session, content: ContentCreate) -> Content:
+def create_content(db: Session, content: ContentCreate, commit: bool = True) -> Content:
     """Create new content"""
     try:
-        content_data = content.dict()
-        if 'tags' in content_data and isinstance(content_data['tags'], list):
-            tags_list = content_data.pop('tags')
-            db_content = Content(**content_data)
-            db_content.tags_list = tags_list
-        else:
-            db_content = Content(**content_data)
+        # Validated request model -> column values
+        values = {**content.model_dump(exclude={'tags'}), 'tags': content.tags or []}
         
-        db.add(db_content)
-        db.commit()
-        db.refresh(db_content)
-        logger.info(f"Created content: {db_content.title} (ID: {db_content.id})")
+        # Generated id/defaults come back with the INSERT (see create_project)
+        db_content = db.execute(insert(Content).values(**values).returning(Content)).scalar_one()
+        _end_write(db, commit)
+        logger.info("Created content: %s (ID: %d)", db_content.title, db_content.id)
         return db_content
     except Exception as e:
         db.rollback()
@@ -145,63 +387,195 @@ def create_content(db: Session, content: ContentCreate) -> Content:
         raise
 
 
-def get_content(db: Session, content_id: int) -> Optional[Content]:
-    """Get content by ID"""
+def create_content_bulk(db: Session, contents: List[ContentCreate]) -> int:
+    """
+    Create many content items with one multi-row INSERT in one transaction.
+    Items whose slug already exists are skipped. Returns the number inserted.
+    """
+    if not contents:
+        return 0
+    
+    try:
+        rows = [
+            {**content.model_dump(exclude={'tags'}), 'tags': content.tags or []}
+            for content in contents
+        ]
+        
+        stmt = _dialect_insert(db.bind.dialect)(Content).values(rows).on_conflict_do_nothing(index_elements=['slug'])
+        
+        result = db.execute(stmt)
+        db.commit()
+        logger.info("Bulk created %d of %d content items", result.rowcount, len(rows))
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error bulk creating content: {e}")
+        raise
+
+
+# Content's large TEXT columns, deferred on the model
+CONTENT_TEXT_FIELDS = ("raw_content", "enhanced_content")
+
+
+def _undefer_text(query, text_fields: Sequence[str]):
+    """Load the given deferred TEXT columns with the row (Query or select())"""
+    return query.options(*(undefer(getattr(Content, field)) for field in text_fields))
+
+
+def get_content(db: Session, content_id: int, text_fields: Sequence[str] = CONTENT_TEXT_FIELDS) -> Optional[Content]:
+    """Get content by ID, loading text_fields (a subset of CONTENT_TEXT_FIELDS) up front"""
     try:
-        return db.query(Content).filter(Content.id == content_id).first()
+        # Session.get checks the identity map before querying
+        return db.get(Content, content_id, options=[undefer(getattr(Content, field)) for field in text_fields])
     except Exception as e:
         logger.error(f"Error getting content {content_id}: {e}")
         raise
 
 
-def get_content_by_slug(db: Session, slug: str) -> Optional[Content]:
-    """Get content by slug"""
+def content_exists(db: Session, content_id: int) -> bool:
+    """Check content exists without loading the row (or its TEXT columns)"""
+    try:
+        return db.execute(_CONTENT_EXISTS, {"content_id": content_id}).scalar() is not None
+    except Exception as e:
+        logger.error(f"Error checking content {content_id} exists: {e}")
+        raise
+
+
+@lru_cache(maxsize=None)
+def _content_by_slug_stmt(text_fields: Tuple[str, ...]):
+    """_CONTENT_BY_SLUG loading text_fields, built once per combination"""
+    return _undefer_text(_CONTENT_BY_SLUG, text_fields)
+
+
+def get_content_by_slug(db: Session, slug: str, text_fields: Sequence[str] = CONTENT_TEXT_FIELDS) -> Optional[Content]:
+    """Get content by slug, loading text_fields (a subset of CONTENT_TEXT_FIELDS) up front"""
     try:
-        return db.query(Content).filter(Content.slug == slug).first()
+        return db.scalars(_content_by_slug_stmt(tuple(text_fields)), {"slug": slug}).first()
     except Exception as e:
         logger.error(f"Error getting content by slug {slug}: {e}")
         raise
 
 
+def _filter_content(query, filters: Dict[str, Any] = None):
+    """Apply the supported content list filters to a query"""
+    if filters:
+        if 'project_id' in filters:
+            query = query.filter(Content.project_id == filters['project_id'])
+        if 'content_type' in filters:
+            query = query.filter(Content.content_type == filters['content_type'])
+        if 'status' in filters:
+            query = query.filter(_status_equals(Content.status, ContentStatus, filters['status']))
+        if 'tag' in filters:
+            query = query.filter(_json_array_contains(Content, Content.tags, filters['tag']))
+    return query
+
+
 def get_content_list(db: Session, skip: int = 0, limit: int = 100, filters: Dict[str, Any] = None) -> List[Content]:
     """Get content with optional filtering"""
     try:
-        query = db.query(Content)
-        
-        if filters:
-            if 'project_id' in filters:
-                query = query.filter(Content.project_id == filters['project_id'])
-            if 'content_type' in filters:
-                query = query.filter(Content.content_type == filters['content_type'])
-            if 'status' in filters:
-                query = query.filter(Content.status == filters['status'])
-        
+        query = _filter_content(db.query(Content), filters)
         return query.offset(skip).limit(limit).all()
     except Exception as e:
         logger.error(f"Error getting content list: {e}")
         raise
 
 
-def update_content(db: Session, content_id: int, content_update: ContentUpdate) -> Optional[Content]:
+def _content_summary_query(db: Session):
+    """
+    Query for content metadata without the large TEXT columns.
+    Rows are (Content, raw_content_length, enhanced_content_length).
+    """
+    return db.query(Content).options(
+        load_only(
+            Content.id, Content.project_id, Content.content_type,
+            Content.title, Content.slug, Content.meta_description,
+            Content.tags, Content.status, Content.created_at
+        )
+    ).add_columns(
+        func.coalesce(func.length(Content.raw_content), 0).label("raw_content_length"),
+        func.coalesce(func.length(Content.enhanced_content), 0).label("enhanced_content_length"),
+    )
+
+
+def get_content_summary(db: Session, content_id: int) -> Optional[Any]:
+    """Get one content summary row (see _content_summary_query) by ID"""
+    try:
+        return _content_summary_query(db).filter(Content.id == content_id).first()
+    except Exception as e:
+        logger.error(f"Error getting content summary {content_id}: {e}")
+        raise
+
+
+def iter_content_text(db: Session, content_id: int, field: str, chunk_size: int = 262144):
+    """
+    Yield a content TEXT column ('raw_content' or 'enhanced_content') in
+    chunks read with SQL substr(), so the full value is never held in memory.
+    """
+    column = getattr(Content, field)
+    offset = 1
+    while True:
+        chunk = db.query(func.substr(column, offset, chunk_size)).filter(Content.id == content_id).scalar()
+        if not chunk:
+            break
+        yield chunk
+        if len(chunk) < chunk_size:
+            break
+        offset += chunk_size
+
+
+def get_content_summaries(db: Session, skip: int = 0, limit: int = 100, filters: Dict[str, Any] = None) -> List[Any]:
+    """
+    Get content list-view rows without loading the large TEXT columns.
+    Returns (Content, raw_content_length, enhanced_content_length) rows.
+    """
+    try:
+        query = _filter_content(_content_summary_query(db), filters)
+        return query.offset(skip).limit(limit).all()
+    except Exception as e:
+        logger.error(f"Error getting content summaries: {e}")
+        raise
+
+
+def iter_content(db: Session, filters: Dict[str, Any] = None, batch_size: int = 500):
+    """
+    Stream content matching the filters, fetching batch_size rows at a time
+    (server-side cursor where supported) instead of materializing the list.
+    """
+    stmt = _filter_content(select(Content), filters).order_by(Content.id)
+    stmt = _undefer_text(stmt, CONTENT_TEXT_FIELDS)
+    yield from db.scalars(stmt.execution_options(yield_per=batch_size))
+
+
+def count_content(db: Session, filters: Dict[str, Any] = None) -> int:
+    """Count content matching the filters with a single COUNT(*) query"""
+    try:
+        query = _filter_content(db.query(func.count(Content.id)), filters)
+        return query.scalar()
+    except Exception as e:
+        logger.error(f"Error counting content: {e}")
+        raise
+
+
+def update_content(db: Session, content_id: int, content_update: ContentUpdate,
+                   commit: bool = True) -> Optional[Content]:
     """Update content"""
     try:
-        db_content = db.query(Content).filter(Content.id == content_id).first()
+        db_content = db.get(Content, content_id)
         if not db_content:
             return None
         
-        update_data = content_update.dict(exclude_unset=True)
+        update_data = content_update.model_dump(exclude_unset=True)
         
-        # Handle tags update
+        # tags may be sent as null; store an empty list
         if 'tags' in update_data:
-            tags_list = update_data.pop('tags')
-            db_content.tags_list = tags_list
+            update_data['tags'] = update_data['tags'] or []
         
         for field, value in update_data.items():
             setattr(db_content, field, value)
         
-        db.commit()
+        _end_write(db, commit)
         db.refresh(db_content)
-        logger.info(f"Updated content: {db_content.title} (ID: {content_id})")
+        logger.info("Updated content: %s (ID: %d)", db_content.title, content_id)
         return db_content
     except Exception as e:
         db.rollback()
@@ -209,16 +583,16 @@ def update_content(db: Session, content_id: int, content_update: ContentUpdate)
         raise
 
 
-def delete_content(db: Session, content_id: int) -> bool:
+def delete_content(db: Session, content_id: int, commit: bool = True) -> bool:
     """Delete content"""
     try:
-        db_content = db.query(Content).filter(Content.id == content_id).first()
+        db_content = db.get(Content, content_id)
         if not db_content:
             return False
         
         db.delete(db_content)
-        db.commit()
-        logger.info(f"Deleted content ID: {content_id}")
+        _end_write(db, commit)
+        logger.info("Deleted content ID: %d", content_id)
         return True
     except Exception as e:
         db.rollback()
@@ -269,21 +643,33 @@ def seed_database(db: Session):
         }
     ]
     
-    # Create projects
-    created_projects = []
-    for project_data in sample_projects:
-        # Check if project already exists
-        existing = ProjectService.get_project_by_url(db, project_data["url"])
-        if not existing:
-            project = ProjectService.create_project(db, project_data)
-            created_projects.append(project)
-        else:
-            created_projects.append(existing)
+    # Look up which sample projects exist with one IN query and insert only
+    # the missing ones in one batch (re-seeding then costs a single SELECT)
+    project_ids_stmt = select(Project.url, Project.id).where(
+        Project.url.in_([p["url"] for p in sample_projects])
+    )
+    # Projects and content are written in one transaction with a single
+    # commit (one WAL sync on SQLite)
+    project_ids = dict(db.execute(project_ids_stmt).all())
+    new_projects = [p for p in sample_projects if p["url"] not in project_ids]
+    try:
+        if new_projects:
+            # RETURNING hands back the new ids with the insert, so no second
+            # lookup is needed unless a row was skipped
+            project_ids.update(_insert_rows(
+                db, Project, new_projects, 'url', commit=False, returning=(Project.url, Project.id)
+            ))
+        if len(project_ids) < len(sample_projects):
+            project_ids = dict(db.execute(project_ids_stmt).all())
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error seeding projects: {e}")
+        raise
     
     # Sample content
     sample_contents = [
         {
-            "project_id": created_projects[0].id,
+            "project_id": project_ids[sample_projects[0]["url"]],
             "content_type": "blog_post",
             "title": "Visual Studio Code: The Developer's Best Friend",
             "slug": "vscode-developers-best-friend",
@@ -294,7 +680,7 @@ def seed_database(db: Session):
             "status": "published"
         },
         {
-            "project_id": created_projects[1].id,
+            "project_id": project_ids[sample_projects[1]["url"]],
             "content_type": "tutorial",
             "title": "Getting Started with FastAPI",
             "slug": "getting-started-fastapi",
@@ -306,39 +692,43 @@ def seed_database(db: Session):
         }
     ]
     
-    # Create content
-    for content_data in sample_contents:
-        # Check if content already exists
-        existing = ContentService.get_content_by_slug(db, content_data["slug"])
-        if not existing:
-            ContentService.create_content(db, content_data)
+    # Same for content, by slug
+    try:
+        existing_slugs = set(db.scalars(
+            select(Content.slug).where(Content.slug.in_([c["slug"] for c in sample_contents]))
+        ))
+        new_contents = [c for c in sample_contents if c["slug"] not in existing_slugs]
+        if new_contents:
+            _insert_rows(db, Content, new_contents, 'slug', commit=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error seeding content: {e}")
+        raise
     
     logger.info("Database seeding completed successfully!")
 
 
 # Health check functions
+def _count_by_status(db: Session, model) -> Dict[str, int]:
+    """Row counts per status for a table, from one GROUP BY scan"""
+    rows = db.execute(select(model.status, func.count()).group_by(model.status)).all()
+    return {status.value: count for status, count in rows}
+
+
 def get_database_stats(db: Session) -> Dict[str, Any]:
     """Get database statistics for health checks"""
     try:
-        project_count = db.query(Project).count()
-        content_count = db.query(Content).count()
-        
-        # Get counts by status
-        project_statuses = db.query(
-            Project.status,
-            db.func.count(Project.id).label('count')
-        ).group_by(Project.status).all()
-        
-        content_statuses = db.query(
-            Content.status,
-            db.func.count(Content.id).label('count')
-        ).group_by(Content.status).all()
+        # One grouped query per table; status is NOT NULL, so the per-status
+        # counts sum to the table total without a separate COUNT(*)
+        project_statuses = _count_by_status(db, Project)
+        content_statuses = _count_by_status(db, Content)
         
         return {
-            "total_projects": project_count,
-            "total_content": content_count,
-            "project_statuses": {status: count for status, count in project_statuses},
-            "content_statuses": {status: count for status, count in content_statuses},
+            "total_projects": sum(project_statuses.values()),
+            "total_content": sum(content_statuses.values()),
+            "project_statuses": project_statuses,
+            "content_statuses": content_statuses,
         }
     except Exception as e:
         logger.error(f"Error getting database stats: {e}")
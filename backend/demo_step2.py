@@ -13,25 +13,72 @@ Run this script to validate Step 2 completion.
 """
 
 import asyncio
+import atexit
+import io
 import sys
-import json
 import sqlite3
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Add current directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
+from app.core.database import (
+    AsyncSessionLocal, SessionLocal, ensure_tables, get_connection_info, test_connection
+)
+from app.models.schemas import ProjectCreate, ContentCreate, ContentUpdate
+from app.services import database_service as service
+
 print("🚀 CodeBridge Step 2: Database Foundation Demonstration")
 print("=" * 60)
 
+DB_PATH = Path("./codebridge.db").absolute()
+
+# One SQLite connection shared by the schema checks (steps 2 and 7)
+_sqlite_conn = None
+
+
+def _get_conn():
+    """Open the demo database once and reuse the connection"""
+    global _sqlite_conn
+    if _sqlite_conn is None:
+        # Step 7 runs in a worker thread (see main), after step 2 opened it
+        _sqlite_conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    return _sqlite_conn
+
+
+@atexit.register
+def _close_conn():
+    if _sqlite_conn is not None:
+        _sqlite_conn.close()
+
+
+# {table: {column: type}} for the demo tables, read once by step 2 and
+# reused by step 7
+_table_columns = None
+
+
+def _introspect():
+    """Read the projects/content column types once (one PRAGMA per table)"""
+    global _table_columns
+    if _table_columns is None:
+        conn = _get_conn()
+        _table_columns = {
+            table: {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for table in ("projects", "content")
+        }
+    return _table_columns
+
+
 def step1_test_imports():
     """Step 1: Test all database imports"""
     print("\n📦 Step 1: Testing Database Imports...")
     try:
         from app.core.database import SessionLocal, create_tables, get_connection_info
         from app.models.database import Project, Content, Base
-        from app.services.database_service import ProjectService, ContentService, seed_database
+        from app.services.database_service import create_project, create_content, seed_database
         from app.core.config import settings
         print("✅ All database imports successful")
         print(f"   Database URL: {settings.DATABASE_URL}")
@@ -44,18 +91,12 @@ def step2_create_database():
     """Step 2: Create database and tables"""
     print("\n🏗️  Step 2: Creating Database Tables...")
     try:
-        from app.core.database import create_tables
-        create_tables()
+        ensure_tables()
         
         # Verify tables exist by checking SQLite database
-        db_path = "./codebridge.db"
-        if Path(db_path).exists():
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
+        if DB_PATH.exists():
             # Check tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
+            tables = [row[0] for row in _get_conn().execute("SELECT name FROM sqlite_master WHERE type='table';")]
             
             expected_tables = ['projects', 'content']
             if all(table in tables for table in expected_tables):
@@ -63,16 +104,12 @@ def step2_create_database():
                 print(f"   Tables created: {tables}")
                 
                 # Check table schema
-                for table in expected_tables:
-                    cursor.execute(f"PRAGMA table_info({table});")
-                    columns = cursor.fetchall()
+                for table, columns in _introspect().items():
                     print(f"   {table} columns: {len(columns)}")
                 
-                conn.close()
                 return True
             else:
                 print(f"❌ Missing tables. Found: {tables}, Expected: {expected_tables}")
-                conn.close()
                 return False
         else:
             print("❌ Database file not created")
@@ -86,8 +123,6 @@ def step3_test_connection_pooling():
     """Step 3: Test connection pooling configuration"""
     print("\n🔌 Step 3: Testing Connection Pooling...")
     try:
-        from app.core.database import get_connection_info
-        
         connection_info = get_connection_info()
         print("✅ Connection pooling configured")
         print(f"   Pool size: {connection_info.get('pool_size', 'N/A')}")
@@ -103,8 +138,6 @@ async def step4_test_async_connection():
     """Step 4: Test async database connection"""
     print("\n⚡ Step 4: Testing Async Database Connection...")
     try:
-        from app.core.database import test_connection
-        
         result = await test_connection()
         if result:
             print("✅ Async database connection successful")
@@ -117,78 +150,83 @@ async def step4_test_async_connection():
         print(f"❌ Async connection test error: {e}")
         return False
 
-def step5_test_crud_operations():
+# Step 5 fixtures, validated once; the services only read them
+DEMO_PROJECT = ProjectCreate(
+    platform="github",
+    url="https://github.com/step2/demo-project",
+    name="Step 2 Demo Project",
+    description="Demonstration project for Step 2 database foundation",
+    stars=150,
+    language="Python",
+    topics=["fastapi", "database", "sqlalchemy", "demo"],
+    quality_score=9.2,
+    status="analyzed"
+)
+
+# ContentCreate fields except project_id, which is only known after the
+# project is created
+DEMO_CONTENT_FIELDS = dict(
+    content_type="blog",
+    title="Building Modern APIs with FastAPI",
+    slug="building-modern-apis-fastapi",
+    raw_content="# Building Modern APIs with FastAPI\n\nFastAPI is a modern framework...",
+    enhanced_content="# Building Modern APIs with FastAPI: A Complete Guide\n\nDiscover the power...",
+    meta_description="Learn how to build high-performance APIs using FastAPI framework",
+    tags=["fastapi", "python", "api", "tutorial"],
+    status="published"
+)
+
+
+async def step5_test_crud_operations():
     """Step 5: Test comprehensive CRUD operations"""
     print("\n📝 Step 5: Testing CRUD Operations...")
     try:
-        from app.core.database import SessionLocal
-        from app.services.database_service import ProjectService, ContentService
-        
-        db = SessionLocal()
-        
-        # CREATE: Test project creation
-        project_data = {
-            "platform": "github",
-            "url": "https://github.com/step2/demo-project",
-            "name": "Step 2 Demo Project",
-            "description": "Demonstration project for Step 2 database foundation",
-            "stars": 150,
-            "language": "Python",
-            "topics": ["fastapi", "database", "sqlalchemy", "demo"],
-            "quality_score": 9.2,
-            "status": "analyzed"
-        }
-        
-        project = ProjectService.create_project(db, project_data)
-        print(f"✅ Project CREATED: {project.name} (ID: {project.id})")
-        print(f"   Topics: {project.topics_list}")
-        
-        # CREATE: Test content creation
-        content_data = {
-            "project_id": project.id,
-            "content_type": "blog_post",
-            "title": "Building Modern APIs with FastAPI",
-            "slug": "building-modern-apis-fastapi",
-            "raw_content": "# Building Modern APIs with FastAPI\n\nFastAPI is a modern framework...",
-            "enhanced_content": "# Building Modern APIs with FastAPI: A Complete Guide\n\nDiscover the power...",
-            "meta_description": "Learn how to build high-performance APIs using FastAPI framework",
-            "tags": ["fastapi", "python", "api", "tutorial"],
-            "status": "published"
-        }
-        
-        content = ContentService.create_content(db, content_data)
-        print(f"✅ Content CREATED: {content.title} (ID: {content.id})")
-        print(f"   Tags: {content.tags_list}")
-        
-        # READ: Test reading operations
-        retrieved_project = ProjectService.get_project(db, project.id)
-        retrieved_content = ContentService.get_content(db, content.id)
-        
-        if retrieved_project and retrieved_content:
-            print("✅ Records READ successfully")
-            print(f"   Project: {retrieved_project.name}")
-            print(f"   Content: {retrieved_content.title}")
-        
-        # UPDATE: Test update operations
-        update_data = {"status": "featured", "stars": 200}
-        updated_project = ProjectService.update_project(db, project.id, update_data)
-        print(f"✅ Project UPDATED: Status={updated_project.status}, Stars={updated_project.stars}")
-        
-        content_update = {"status": "featured", "meta_description": "Updated description"}
-        updated_content = ContentService.update_content(db, content.id, content_update)
-        print(f"✅ Content UPDATED: Status={updated_content.status}")
-        
-        # SEARCH: Test search operations
-        projects = ProjectService.get_projects(db, platform="github", limit=5)
-        contents = ContentService.get_content_by_project(db, project.id)
-        print(f"✅ SEARCH operations: Found {len(projects)} projects, {len(contents)} content items")
-        
-        # DELETE: Test deletion (cleanup)
-        ContentService.delete_content(db, content.id)
-        ProjectService.delete_project(db, project.id)
-        print("✅ Records DELETED successfully (cleanup)")
+        # Project services are async; the sync content services run on the
+        # same session through run_sync, so nothing blocks the event loop.
+        # All writes share one transaction (commit=False), committed once
+        async with AsyncSessionLocal() as db, db.begin():
+            # CREATE: Test project creation
+            project = await service.create_project(db, DEMO_PROJECT, commit=False)
+            if project is None:
+                project = await service.get_project_by_url(db, DEMO_PROJECT.url)
+            print(f"✅ Project CREATED: {project.name} (ID: {project.id})")
+            print(f"   Topics: {project.topics}")
+            
+            # CREATE: Test content creation
+            content_data = ContentCreate(project_id=project.id, **DEMO_CONTENT_FIELDS)
+            
+            content = await db.run_sync(service.create_content, content_data, commit=False)
+            print(f"✅ Content CREATED: {content.title} (ID: {content.id})")
+            print(f"   Tags: {content.tags}")
+            
+            # READ: Test reading operations
+            retrieved_project = await service.get_project(db, project.id)
+            retrieved_content = await db.run_sync(service.get_content, content.id)
+            
+            if retrieved_project and retrieved_content:
+                print("✅ Records READ successfully")
+                print(f"   Project: {retrieved_project.name}")
+                print(f"   Content: {retrieved_content.title}")
+            
+            # UPDATE: Test update operations
+            update_data = {"status": "processed", "stars": 200}
+            updated_project = await service.update_project(db, project.id, update_data, commit=False)
+            print(f"✅ Project UPDATED: Status={updated_project.status.value}")
+            
+            content_update = ContentUpdate(status="archived", meta_description="Updated description")
+            updated_content = await db.run_sync(service.update_content, content.id, content_update, commit=False)
+            print(f"✅ Content UPDATED: Status={updated_content.status.value}")
+            
+            # SEARCH: Test search operations
+            projects = await service.get_projects(db, limit=5, filters={"platform": "github"})
+            contents = await db.run_sync(service.get_content_list, filters={"project_id": project.id})
+            print(f"✅ SEARCH operations: Found {len(projects)} projects, {len(contents)} content items")
+            
+            # DELETE: Test deletion (cleanup)
+            await db.run_sync(service.delete_content, content.id, commit=False)
+            await service.delete_project(db, project.id, commit=False)
+            print("✅ Records DELETED successfully (cleanup)")
         
-        db.close()
         return True
         
     except Exception as e:
@@ -199,20 +237,17 @@ def step6_test_database_seeding():
     """Step 6: Test database seeding functionality"""
     print("\n🌱 Step 6: Testing Database Seeding...")
     try:
-        from app.core.database import SessionLocal
-        from app.services.database_service import seed_database, get_database_stats
-        
         db = SessionLocal()
         
         # Get initial stats
-        initial_stats = get_database_stats(db)
+        initial_stats = service.get_database_stats(db)
         print(f"   Initial stats: {initial_stats.get('total_projects', 0)} projects, {initial_stats.get('total_content', 0)} content")
         
         # Seed database
-        seed_database(db)
+        service.seed_database(db)
         
         # Get final stats
-        final_stats = get_database_stats(db)
+        final_stats = service.get_database_stats(db)
         print(f"✅ Database seeding completed")
         print(f"   Final stats: {final_stats.get('total_projects', 0)} projects, {final_stats.get('total_content', 0)} content")
         print(f"   Project statuses: {final_stats.get('project_statuses', {})}")
@@ -229,14 +264,11 @@ def step7_verify_schema_compliance():
     """Step 7: Verify schema matches you.md requirements"""
     print("\n📋 Step 7: Verifying Schema Compliance with you.md...")
     try:
-        # Check database file
-        db_path = "./codebridge.db"
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        # Column types as read by step 2
+        table_columns = _introspect()
         
         # Check projects table schema
-        cursor.execute("PRAGMA table_info(projects);")
-        projects_columns = {row[1]: row[2] for row in cursor.fetchall()}
+        projects_columns = table_columns["projects"]
         
         expected_projects_columns = {
             'id': 'INTEGER',
@@ -246,15 +278,14 @@ def step7_verify_schema_compliance():
             'description': 'TEXT',
             'stars': 'INTEGER',
             'language': 'VARCHAR(50)',
-            'topics': 'TEXT',
+            'topics': 'JSON',
             'quality_score': 'DECIMAL(3, 2)',
             'scraped_at': 'DATETIME',
             'status': 'VARCHAR(20)'
         }
         
         # Check content table schema
-        cursor.execute("PRAGMA table_info(content);")
-        content_columns = {row[1]: row[2] for row in cursor.fetchall()}
+        content_columns = table_columns["content"]
         
         expected_content_columns = {
             'id': 'INTEGER',
@@ -265,20 +296,16 @@ def step7_verify_schema_compliance():
             'raw_content': 'TEXT',
             'enhanced_content': 'TEXT',
             'meta_description': 'VARCHAR(160)',
-            'tags': 'TEXT',
+            'tags': 'JSON',
             'status': 'VARCHAR(20)',
             'created_at': 'DATETIME'
         }
         
-        # Verify projects schema
-        projects_match = all(
-            col in projects_columns for col in expected_projects_columns.keys()
-        )
-        
-        # Verify content schema
-        content_match = all(
-            col in content_columns for col in expected_content_columns.keys()
-        )
+        # Verify both schemas: expected columns missing from each table
+        missing_projects = expected_projects_columns.keys() - projects_columns.keys()
+        missing_content = expected_content_columns.keys() - content_columns.keys()
+        projects_match = not missing_projects
+        content_match = not missing_content
         
         if projects_match and content_match:
             print("✅ Schema compliance verified")
@@ -288,52 +315,99 @@ def step7_verify_schema_compliance():
         else:
             print("❌ Schema compliance failed")
             if not projects_match:
-                missing = set(expected_projects_columns.keys()) - set(projects_columns.keys())
-                print(f"   Missing projects columns: {missing}")
+                print(f"   Missing projects columns: {missing_projects}")
             if not content_match:
-                missing = set(expected_content_columns.keys()) - set(content_columns.keys())
-                print(f"   Missing content columns: {missing}")
+                print(f"   Missing content columns: {missing_content}")
         
-        conn.close()
         return projects_match and content_match
         
     except Exception as e:
         print(f"❌ Schema verification failed: {e}")
         return False
 
+
+# Output buffer of the step running in the current context (see _run_step).
+# Worker threads started by asyncio.to_thread inherit the context
+_step_output: ContextVar[Optional[io.StringIO]] = ContextVar("_step_output", default=None)
+
+
+class _StepStdout:
+    """sys.stdout stand-in that sends a running step's prints to its buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _step_output.get()
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+async def _run_step(step_func, is_async: bool):
+    """
+    Run one step and return (result, printed output). Sync steps go to a
+    worker thread so they can overlap; each step prints into its own buffer
+    so concurrent steps don't interleave. An exception is returned as the
+    result, keeping the output printed before it.
+    """
+    output = io.StringIO()
+    _step_output.set(output)
+    try:
+        if is_async:
+            result = await step_func()
+        else:
+            result = await asyncio.to_thread(step_func)
+    except Exception as e:
+        result = e
+    return result, output.getvalue()
+
+
 async def main():
     """Run complete Step 2 demonstration"""
-    print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🕐 Started at: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
     
-    steps = [
-        ("Import Testing", step1_test_imports),
-        ("Database Creation", step2_create_database),
-        ("Connection Pooling", step3_test_connection_pooling),
-        ("Async Connection", step4_test_async_connection),
-        ("CRUD Operations", step5_test_crud_operations),
-        ("Database Seeding", step6_test_database_seeding),
-        ("Schema Compliance", step7_verify_schema_compliance),
+    # Phases run in order; the steps within a phase are independent
+    # (read-only once the tables exist) and run concurrently.
+    # Entries are (name, step, is_async)
+    phases = [
+        [("Database Creation", step2_create_database, False)],
+        [
+            ("Import Testing", step1_test_imports, False),
+            ("Connection Pooling", step3_test_connection_pooling, False),
+            ("Async Connection", step4_test_async_connection, True),
+            ("Schema Compliance", step7_verify_schema_compliance, False),
+        ],
+        [("CRUD Operations", step5_test_crud_operations, True)],
+        [("Database Seeding", step6_test_database_seeding, False)],
     ]
     
     passed = 0
-    total = len(steps)
+    total = sum(len(phase) for phase in phases)
     
-    for step_name, step_func in steps:
-        print(f"\n{'─' * 60}")
+    for phase in phases:
+        sys.stdout = _StepStdout(sys.stdout)
         try:
-            if asyncio.iscoroutinefunction(step_func):
-                result = await step_func()
-            else:
-                result = step_func()
-                
-            if result:
+            results = await asyncio.gather(
+                *(_run_step(step_func, is_async) for _, step_func, is_async in phase)
+            )
+        finally:
+            sys.stdout = sys.stdout._stream
+        
+        # Each step's output in step order, under its own header
+        for (step_name, _, _), (result, output) in zip(phase, results):
+            print(f"\n{'═' * 60}")
+            print(f"▶ {step_name}")
+            print(output, end="")
+            print(f"\n{'─' * 60}")
+            if isinstance(result, Exception):
+                print(f"❌ {step_name}: ERROR - {result}")
+            elif result:
                 passed += 1
                 print(f"✅ {step_name}: PASSED")
             else:
                 print(f"❌ {step_name}: FAILED")
-                
-        except Exception as e:
-            print(f"❌ {step_name}: ERROR - {e}")
     
     # Final results
     print(f"\n{'=' * 60}")
@@ -352,7 +426,7 @@ async def main():
         print("\n🚀 Ready to proceed to Step 3!")
         
         # Show next steps
-        print(f"\n📁 Database file: {Path('./codebridge.db').absolute()}")
+        print(f"\n📁 Database file: {DB_PATH}")
         print("🌐 Start the server: python -m uvicorn app.main:app --port 3047")
         print("🔍 Health check: http://localhost:3047/api/health/database")
         print("📚 API docs: http://localhost:3047/docs")
@@ -15,9 +15,11 @@ sys.path.append(str(Path(__file__).parent))
 
 from alembic.config import Config
 from alembic import command
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal, test_connection, create_tables, drop_tables
+from app.core.database import SessionLocal, engine, test_connection, create_tables, drop_tables
 from app.services.database_service import seed_database
 
 # Setup logging
@@ -25,11 +27,29 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def run_migrations():
-    """Run Alembic migrations to latest"""
+def is_at_head(alembic_cfg: Config) -> bool:
+    """Check the database's alembic_version against the script heads"""
+    heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+    with engine.connect() as conn:
+        current = set(MigrationContext.configure(conn).get_current_heads())
+    return current == heads
+
+
+def run_migrations(sql: bool = False):
+    """
+    Run Alembic migrations to latest. Skips Alembic's environment entirely
+    when the database is already at head. With sql=True, print the upgrade
+    SQL (offline mode) instead of running it.
+    """
     try:
-        logger.info("Running database migrations...")
         alembic_cfg = Config("alembic.ini")
+        if sql:
+            command.upgrade(alembic_cfg, "head", sql=True)
+            return True
+        if is_at_head(alembic_cfg):
+            logger.info("✅ Database is already at the latest migration")
+            return True
+        logger.info("Running database migrations...")
         command.upgrade(alembic_cfg, "head")
         logger.info("✅ Database migrations completed successfully!")
         return True
@@ -95,8 +115,11 @@ def reset_db():
     """Reset database (drop and recreate tables)"""
     try:
         logger.info("Resetting database...")
-        drop_tables()
-        create_tables()
+        # One transaction: a failed reset leaves the old tables in place
+        # (where the database has transactional DDL, e.g. PostgreSQL)
+        with engine.begin() as conn:
+            drop_tables(conn)
+            create_tables(conn)
         logger.info("✅ Database reset completed successfully!")
         return True
     except Exception as e:
@@ -130,42 +153,34 @@ async def init_db():
 def main():
     """Main management function"""
     parser = argparse.ArgumentParser(description="CodeBridge Backend Management")
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Available commands")
     
+    # Each command sets its handler, called with the parsed args
     # Migration commands
     migrate_parser = subparsers.add_parser("migrate", help="Run database migrations")
+    migrate_parser.add_argument("--sql", action="store_true", help="Print the migration SQL instead of running it")
+    migrate_parser.set_defaults(handler=lambda args: run_migrations(sql=args.sql))
     
     rollback_parser = subparsers.add_parser("rollback", help="Rollback database migrations")
     rollback_parser.add_argument("--revision", default="-1", help="Revision to rollback to")
+    rollback_parser.set_defaults(handler=lambda args: rollback_migrations(args.revision))
     
     makemigration_parser = subparsers.add_parser("makemigration", help="Create new migration")
     makemigration_parser.add_argument("message", help="Migration message")
+    makemigration_parser.set_defaults(handler=lambda args: create_migration(args.message))
     
     # Database commands
-    subparsers.add_parser("test-db", help="Test database connection")
-    subparsers.add_parser("seed", help="Seed database with initial data")
-    subparsers.add_parser("reset-db", help="Reset database (drop and recreate)")
-    subparsers.add_parser("init-db", help="Initialize database (migrate + seed)")
+    subparsers.add_parser("test-db", help="Test database connection").set_defaults(
+        handler=lambda args: asyncio.run(test_db_connection()))
+    subparsers.add_parser("seed", help="Seed database with initial data").set_defaults(
+        handler=lambda args: seed_db())
+    subparsers.add_parser("reset-db", help="Reset database (drop and recreate)").set_defaults(
+        handler=lambda args: reset_db())
+    subparsers.add_parser("init-db", help="Initialize database (migrate + seed)").set_defaults(
+        handler=lambda args: asyncio.run(init_db()))
     
     args = parser.parse_args()
-    
-    if args.command == "migrate":
-        success = run_migrations()
-    elif args.command == "rollback":
-        success = rollback_migrations(args.revision)
-    elif args.command == "makemigration":
-        success = create_migration(args.message)
-    elif args.command == "test-db":
-        success = asyncio.run(test_db_connection())
-    elif args.command == "seed":
-        success = seed_db()
-    elif args.command == "reset-db":
-        success = reset_db()
-    elif args.command == "init-db":
-        success = asyncio.run(init_db())
-    else:
-        parser.print_help()
-        success = False
+    success = args.handler(args)
     
     sys.exit(0 if success else 1)
 
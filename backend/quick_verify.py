@@ -5,6 +5,7 @@ Quick System Verification
 This script performs a quick verification that all components are working.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -42,7 +43,7 @@ def quick_test():
     # Test 3: Service imports
     print("\n3. Testing service imports...")
     try:
-        from app.services.database_service import ProjectService, ContentService
+        from app.services.database_service import create_project, create_content, get_projects, get_content_list
         print("   ✅ Service modules imported")
         tests_passed += 1
     except Exception as e:
@@ -61,8 +62,8 @@ def quick_test():
     # Test 5: Database creation
     print("\n5. Testing database creation...")
     try:
-        from app.core.database import create_tables
-        create_tables()
+        from app.core.database import ensure_tables
+        ensure_tables()
         print("   ✅ Database tables created")
         tests_passed += 1
     except Exception as e:
@@ -71,16 +72,17 @@ def quick_test():
     # Test 6: Basic CRUD
     print("\n6. Testing basic database operations...")
     try:
-        from app.core.database import SessionLocal
-        from app.services.database_service import ProjectService
+        from app.core.database import AsyncSessionLocal
+        from app.services.database_service import get_projects
         
-        db = SessionLocal()
+        async def list_projects():
+            async with AsyncSessionLocal() as db:
+                return await get_projects(db, limit=10)
         
         # Count existing projects
-        projects = ProjectService.get_projects(db, limit=10)
+        projects = asyncio.run(list_projects())
         print(f"   ✅ Found {len(projects)} projects in database")
         
-        db.close()
         tests_passed += 1
     except Exception as e:
         print(f"   ❌ Database operations failed: {e}")
@@ -7,12 +7,17 @@ It validates all components and starts the system for integration testing.
 """
 
 import asyncio
+import os
 import sys
 import subprocess
 import time
-import requests
+import httpx
+from collections import deque
 from pathlib import Path
 import logging
+import logging.handlers
+
+from server_check import wait_until_ready
 
 # Setup logging
 logging.basicConfig(
@@ -21,6 +26,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Test results are already printed live; their log records are buffered
+# and written in one batch (flushed early on an error, and at exit).
+# The runner's own handler also keeps them in this format after the app
+# import reconfigures root logging.
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+logger.addHandler(logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=_log_output
+))
+logger.propagate = False
+
+SERVER_URL = "http://localhost:3047"
+
+# Lines of a failed validation script's stderr to show
+STDERR_TAIL_LINES = 50
+
+# Files the backend must contain, relative to its directory
+REQUIRED_FILES = (
+    "app/main.py",
+    "app/core/config.py",
+    "app/core/database.py",
+    "app/core/logging_config.py",
+    "app/api/health.py",
+    "app/models/database.py",
+    "app/services/database_service.py",
+    "requirements.txt",
+    "alembic.ini",
+    "manage.py",
+)
+
+# REQUIRED_FILES grouped once by directory: {directory: ((path, name), ...)}
+REQUIRED_FILES_BY_DIR = {}
+for _path in REQUIRED_FILES:
+    _directory, _name = os.path.split(_path)
+    REQUIRED_FILES_BY_DIR[_directory] = REQUIRED_FILES_BY_DIR.get(_directory, ()) + ((_path, _name),)
+
+
 class SystemTestRunner:
     """Comprehensive system test runner"""
     
@@ -42,20 +84,25 @@ class SystemTestRunner:
     def run_validation_script(self, script_name: str) -> bool:
         """Run a validation script and return success status"""
         try:
-            result = subprocess.run(
+            # stdout is never shown, so discard it; stream stderr and keep
+            # only its last lines for the failure report
+            with subprocess.Popen(
                 [sys.executable, script_name],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 cwd=self.base_path
-            )
+            ) as process:
+                stderr_tail = deque(process.stderr, maxlen=STDERR_TAIL_LINES)
+                returncode = process.wait()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log_test(f"Validation: {script_name}", True, "Script executed successfully")
                 return True
             else:
-                self.log_test(f"Validation: {script_name}", False, f"Exit code: {result.returncode}")
-                if result.stderr:
-                    print(f"    Error: {result.stderr}")
+                self.log_test(f"Validation: {script_name}", False, f"Exit code: {returncode}")
+                if stderr_tail:
+                    print(f"    Error: {''.join(stderr_tail)}")
                 return False
                 
         except Exception as e:
@@ -64,29 +111,27 @@ class SystemTestRunner:
     
     def check_file_structure(self) -> bool:
         """Check if all required files exist"""
-        required_files = [
-            "app/main.py",
-            "app/core/config.py",
-            "app/core/database.py",
-            "app/core/logging_config.py",
-            "app/api/health.py",
-            "app/models/database.py",
-            "app/services/database_service.py",
-            "requirements.txt",
-            "alembic.ini",
-            "manage.py"
-        ]
+        # List each directory once instead of a stat() per file; a
+        # directory that doesn't exist lists as empty
+        listings = {}
+        for directory in REQUIRED_FILES_BY_DIR:
+            try:
+                listings[directory] = set(os.listdir(os.path.join(self.base_path, directory)))
+            except OSError:
+                listings[directory] = set()
         
-        missing_files = []
-        for file_path in required_files:
-            if not (self.base_path / file_path).exists():
-                missing_files.append(file_path)
+        missing_files = [
+            file_path
+            for directory, files in REQUIRED_FILES_BY_DIR.items()
+            for file_path, name in files
+            if name not in listings[directory]
+        ]
         
         if missing_files:
             self.log_test("File Structure", False, f"Missing files: {missing_files}")
             return False
         else:
-            self.log_test("File Structure", True, f"All {len(required_files)} required files present")
+            self.log_test("File Structure", True, f"All {len(REQUIRED_FILES)} required files present")
             return True
     
     def test_database_creation(self) -> bool:
@@ -94,37 +139,38 @@ class SystemTestRunner:
         try:
             # Import after ensuring the module path is correct
             sys.path.append(str(self.base_path))
-            from app.core.database import create_tables, SessionLocal
-            from app.services.database_service import ProjectService
+            from app.core.database import create_tables, AsyncSessionLocal
+            from app.models.schemas import ProjectCreate
+            from app.services.database_service import create_project, delete_project
             
             # Create tables
             create_tables()
             
-            # Test basic database operation
-            db = SessionLocal()
-            
             # Test creating a project
-            test_project = {
-                "platform": "github",
-                "url": "https://github.com/test/system-test",
-                "name": "System Test Project",
-                "description": "Test project for system validation",
-                "stars": 1,
-                "language": "Python",
-                "topics": ["test", "validation"],
-                "status": "testing"
-            }
+            test_project = ProjectCreate(
+                platform="github",
+                url="https://github.com/test/system-test",
+                name="System Test Project",
+                description="Test project for system validation",
+                stars=1,
+                language="Python",
+                topics=["test", "validation"],
+                status="discovered"
+            )
             
-            project = ProjectService.create_project(db, test_project)
+            # Create and clean up in one transaction (a single commit)
+            async def create_and_delete():
+                async with AsyncSessionLocal() as db, db.begin():
+                    project = await create_project(db, test_project, commit=False)
+                    if project is None or not project.id:
+                        return False
+                    await delete_project(db, project.id, commit=False)
+                    return True
             
-            if project and project.id:
-                # Clean up
-                ProjectService.delete_project(db, project.id)
-                db.close()
+            if asyncio.run(create_and_delete()):
                 self.log_test("Database Operations", True, "CRUD operations working")
                 return True
             else:
-                db.close()
                 self.log_test("Database Operations", False, "Failed to create project")
                 return False
                 
@@ -135,9 +181,6 @@ class SystemTestRunner:
     def start_server(self) -> bool:
         """Start the FastAPI server"""
         try:
-            import uvicorn
-            from app.main import app
-            
             # Start server in background
             self.server_process = subprocess.Popen([
                 sys.executable, "-m", "uvicorn", 
@@ -147,7 +190,10 @@ class SystemTestRunner:
             ], cwd=self.base_path)
             
             # Wait for server to start
-            time.sleep(5)
+            if not wait_until_ready(f"{SERVER_URL}/api/health/simple", process=self.server_process):
+                self.log_test("Server Start", False, "Server did not become ready")
+                self.stop_server()
+                return False
             
             self.log_test("Server Start", True, "Server started on port 3047")
             return True
@@ -156,7 +202,14 @@ class SystemTestRunner:
             self.log_test("Server Start", False, f"Exception: {e}")
             return False
     
-    def test_health_endpoints(self) -> bool:
+    async def _get_all(self, client: httpx.AsyncClient, endpoints) -> list:
+        """GET (endpoint, description) pairs concurrently; responses or exceptions, in order"""
+        return await asyncio.gather(
+            *(client.get(endpoint) for endpoint, _ in endpoints),
+            return_exceptions=True
+        )
+    
+    async def test_health_endpoints(self, client: httpx.AsyncClient) -> bool:
         """Test health endpoints"""
         endpoints = [
             ("/", "Root endpoint"),
@@ -167,23 +220,19 @@ class SystemTestRunner:
         
         all_passed = True
         
-        for endpoint, description in endpoints:
-            try:
-                response = requests.get(f"http://localhost:3047{endpoint}", timeout=10)
-                
-                if response.status_code == 200:
-                    self.log_test(f"Endpoint: {endpoint}", True, f"{description} - Status: {response.status_code}")
-                else:
-                    self.log_test(f"Endpoint: {endpoint}", False, f"Status: {response.status_code}")
-                    all_passed = False
-                    
-            except requests.exceptions.RequestException as e:
-                self.log_test(f"Endpoint: {endpoint}", False, f"Request failed: {e}")
+        for (endpoint, description), response in zip(endpoints, await self._get_all(client, endpoints)):
+            if isinstance(response, Exception):
+                self.log_test(f"Endpoint: {endpoint}", False, f"Request failed: {response}")
+                all_passed = False
+            elif response.status_code == 200:
+                self.log_test(f"Endpoint: {endpoint}", True, f"{description} - Status: {response.status_code}")
+            else:
+                self.log_test(f"Endpoint: {endpoint}", False, f"Status: {response.status_code}")
                 all_passed = False
         
         return all_passed
     
-    def test_api_documentation(self) -> bool:
+    async def test_api_documentation(self, client: httpx.AsyncClient) -> bool:
         """Test API documentation endpoints"""
         docs_endpoints = [
             ("/docs", "Swagger UI"),
@@ -193,22 +242,45 @@ class SystemTestRunner:
         
         all_passed = True
         
-        for endpoint, description in docs_endpoints:
-            try:
-                response = requests.get(f"http://localhost:3047{endpoint}", timeout=10)
-                
-                if response.status_code == 200:
-                    self.log_test(f"Docs: {endpoint}", True, f"{description} accessible")
-                else:
-                    self.log_test(f"Docs: {endpoint}", False, f"Status: {response.status_code}")
-                    all_passed = False
-                    
-            except requests.exceptions.RequestException as e:
-                self.log_test(f"Docs: {endpoint}", False, f"Request failed: {e}")
+        for (endpoint, description), response in zip(docs_endpoints, await self._get_all(client, docs_endpoints)):
+            if isinstance(response, Exception):
+                self.log_test(f"Docs: {endpoint}", False, f"Request failed: {response}")
+                all_passed = False
+            elif response.status_code == 200:
+                self.log_test(f"Docs: {endpoint}", True, f"{description} accessible")
+            else:
+                self.log_test(f"Docs: {endpoint}", False, f"Status: {response.status_code}")
                 all_passed = False
         
         return all_passed
     
+    async def test_endpoints(self, transport: httpx.AsyncBaseTransport = None, base_url: str = SERVER_URL):
+        """
+        Run the health and docs endpoint checks together over one
+        keep-alive client. Returns (endpoints_ok, docs_ok).
+        Pass an ASGI transport to call the app in-process instead.
+        """
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=10) as client:
+            return await asyncio.gather(
+                self.test_health_endpoints(client),
+                self.test_api_documentation(client)
+            )
+    
+    def test_endpoints_inprocess(self):
+        """
+        Run the endpoint checks against the app in-process through
+        httpx's ASGI transport: no server process, port or sockets.
+        Returns (endpoints_ok, docs_ok).
+        """
+        try:
+            sys.path.append(str(self.base_path))
+            from app.main import app
+        except Exception as e:
+            self.log_test("In-process App", False, f"Exception: {e}")
+            return False, False
+        
+        return asyncio.run(self.test_endpoints(httpx.ASGITransport(app=app), "http://test"))
+    
     def stop_server(self):
         """Stop the server"""
         if self.server_process:
@@ -236,21 +308,20 @@ class SystemTestRunner:
         database_ok = self.test_database_creation()
         
         # Phase 3: Server testing
-        print(f"\n🌐 PHASE 3: SERVER TESTING")
+        print(f"\n🔌 PHASE 3: ENDPOINT TESTING (IN-PROCESS)")
+        print("-" * 50)
+        
+        endpoints_ok, docs_ok = self.test_endpoints_inprocess()
+        
+        # Phase 4: Deployment check; the readiness poll in start_server
+        # proves the real server answers requests
+        print(f"\n🌐 PHASE 4: SERVER TESTING")
         print("-" * 50)
         
         server_ok = self.start_server()
         
         if server_ok:
-            # Test endpoints
-            endpoints_ok = self.test_health_endpoints()
-            docs_ok = self.test_api_documentation()
-            
-            # Stop server
             self.stop_server()
-        else:
-            endpoints_ok = False
-            docs_ok = False
         
         # Final summary
         print(f"\n{'=' * 80}")
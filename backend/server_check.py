@@ -0,0 +1,30 @@
+"""
+Readiness check shared by the scripts that start a local server
+(run_system_tests.py, test_deployment.py)
+"""
+
+import time
+
+import httpx
+
+
+def wait_until_ready(url: str, timeout: float = 15.0, process=None) -> bool:
+    """
+    Poll url until it answers 200, backing off from 0.1s to 0.5s between
+    tries. Gives up after timeout seconds, or as soon as process exits.
+    """
+    deadline = time.monotonic() + timeout
+    interval = 0.1
+    # One keep-alive connection for every poll
+    with httpx.Client(timeout=0.5) as client:
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                return False
+            try:
+                if client.get(url).status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            time.sleep(interval)
+            interval = min(interval * 2, 0.5)
+    return False
@@ -19,7 +19,7 @@ def test_imports():
     try:
         from app.core.database import SessionLocal, create_tables
         from app.models.database import Project, Content, Base
-        from app.services.database_service import ProjectService, ContentService
+        from app.services.database_service import create_project, create_content, get_projects, get_content_list
         logger.info("✅ All imports successful")
         return True
     except Exception as e:
@@ -37,60 +37,68 @@ def test_database_creation():
         logger.error(f"❌ Database creation failed: {e}")
         return False
 
-def test_basic_crud():
-    """Test basic CRUD operations"""
-    try:
-        from app.core.database import SessionLocal
-        from app.services.database_service import ProjectService, ContentService
-        
-        db = SessionLocal()
-        
+async def _basic_crud():
+    """Create, read and delete a project and its content"""
+    from app.core.database import AsyncSessionLocal
+    from app.models.schemas import ProjectCreate, ContentCreate
+    from app.services import database_service as service
+    
+    # One transaction for the whole check (writes use commit=False, the
+    # sync content services run through run_sync); the test records are
+    # deleted again before it commits
+    async with AsyncSessionLocal() as db, db.begin():
         # Test project creation
-        project_data = {
-            "platform": "github",
-            "url": "https://github.com/test/simple-test",
-            "name": "Simple Test Project",
-            "description": "A test project for Step 2",
-            "stars": 1,
-            "language": "Python",
-            "topics": ["test", "demo"],
-            "status": "testing"
-        }
+        project_data = ProjectCreate(
+            platform="github",
+            url="https://github.com/test/simple-test",
+            name="Simple Test Project",
+            description="A test project for Step 2",
+            stars=1,
+            language="Python",
+            topics=["test", "demo"],
+            status="discovered"
+        )
         
-        project = ProjectService.create_project(db, project_data)
+        project = await service.create_project(db, project_data, commit=False)
+        if project is None:
+            project = await service.get_project_by_url(db, project_data.url)
         logger.info(f"✅ Project created: {project.name} (ID: {project.id})")
         
         # Test content creation
-        content_data = {
-            "project_id": project.id,
-            "content_type": "test",
-            "title": "Test Content",
-            "slug": "test-content-simple",
-            "raw_content": "This is test content",
-            "tags": ["test"]
-        }
+        content_data = ContentCreate(
+            project_id=project.id,
+            content_type="blog",
+            title="Test Content",
+            slug="test-content-simple",
+            raw_content="This is test content",
+            tags=["test"]
+        )
         
-        content = ContentService.create_content(db, content_data)
+        content = await db.run_sync(service.create_content, content_data, commit=False)
         logger.info(f"✅ Content created: {content.title} (ID: {content.id})")
         
         # Test reading
-        retrieved_project = ProjectService.get_project(db, project.id)
-        retrieved_content = ContentService.get_content(db, content.id)
+        retrieved_project = await service.get_project(db, project.id)
+        retrieved_content = await db.run_sync(service.get_content, content.id)
         
-        if retrieved_project and retrieved_content:
-            logger.info("✅ CRUD operations successful")
-            
-            # Test topics/tags handling
-            logger.info(f"✅ Project topics: {retrieved_project.topics_list}")
-            logger.info(f"✅ Content tags: {retrieved_content.tags_list}")
-            
-            db.close()
-            return True
-        else:
+        if not (retrieved_project and retrieved_content):
             logger.error("❌ Could not retrieve created records")
-            db.close()
             return False
-            
+        
+        logger.info("✅ CRUD operations successful")
+        
+        # Test topics/tags handling
+        logger.info(f"✅ Project topics: {retrieved_project.topics}")
+        logger.info(f"✅ Content tags: {retrieved_content.tags}")
+        
+        # Clean up (deletes the project's content too)
+        await service.delete_project(db, project.id, commit=False)
+        return True
+
+async def test_basic_crud():
+    """Test basic CRUD operations"""
+    try:
+        return await _basic_crud()
     except Exception as e:
         logger.error(f"❌ CRUD test failed: {e}")
         return False
@@ -109,40 +117,38 @@ async def test_async_connection():
         logger.error(f"❌ Async connection test error: {e}")
         return False
 
-def main():
-    """Run all tests"""
-    logger.info("🧪 Starting Simple Database Tests for Step 2")
-    logger.info("=" * 50)
-    
+async def run_tests():
+    """
+    Run all tests; returns (passed, total). The async tests share this one
+    event loop, so they reuse the async engine's pooled connections.
+    """
     tests = [
-        ("Import Test", test_imports),
-        ("Database Creation", test_database_creation),
-        ("CRUD Operations", test_basic_crud),
+        ("Import Test", test_imports, False),
+        ("Database Creation", test_database_creation, False),
+        ("CRUD Operations", test_basic_crud, True),
+        ("Async Connection Test", test_async_connection, True),
     ]
     
     passed = 0
-    total = len(tests)
     
-    for test_name, test_func in tests:
+    for test_name, test_func, is_async in tests:
         logger.info(f"\n🔧 Running: {test_name}")
         try:
-            if test_func():
+            if await test_func() if is_async else test_func():
                 passed += 1
             else:
                 logger.error(f"❌ {test_name} failed")
         except Exception as e:
             logger.error(f"❌ {test_name} error: {e}")
     
-    # Test async connection
-    logger.info(f"\n🔧 Running: Async Connection Test")
-    try:
-        async_result = asyncio.run(test_async_connection())
-        if async_result:
-            passed += 1
-        total += 1
-    except Exception as e:
-        logger.error(f"❌ Async Connection Test error: {e}")
-        total += 1
+    return passed, len(tests)
+
+def main():
+    """Run all tests"""
+    logger.info("🧪 Starting Simple Database Tests for Step 2")
+    logger.info("=" * 50)
+    
+    passed, total = asyncio.run(run_tests())
     
     logger.info(f"\n" + "=" * 50)
     logger.info(f"📊 RESULTS: {passed}/{total} tests passed")
@@ -6,6 +6,8 @@ This script provides a simple way to start and test the CodeBridge system.
 It includes basic validation and server startup.
 """
 
+import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -22,37 +24,35 @@ def test_imports():
         from app.core.config import settings
         from app.core.database import SessionLocal, create_tables
         from app.models.database import Project, Content
-        from app.services.database_service import ProjectService, ContentService
+        from app.services.database_service import get_projects, get_content_list, seed_database
         print("✅ All core imports successful")
         return True
     except ImportError as e:
         print(f"❌ Import failed: {e}")
         return False
 
-def setup_database():
+async def setup_database():
     """Setup database and test basic operations"""
     print("🗄️  Setting up database...")
     
     try:
-        from app.core.database import create_tables, SessionLocal
-        from app.services.database_service import ProjectService, seed_database
+        from app.core.database import create_tables, SessionLocal, AsyncSessionLocal
+        from app.services.database_service import get_projects, seed_database
         
         # Create tables
         create_tables()
         print("✅ Database tables created")
         
-        # Test database connection
-        db = SessionLocal()
-        
         # Run seeding
-        seed_database(db)
+        with SessionLocal() as db:
+            seed_database(db)
         print("✅ Database seeded with sample data")
         
         # Test a basic query
-        projects = ProjectService.get_projects(db, limit=5)
+        async with AsyncSessionLocal() as db:
+            projects = await get_projects(db, limit=5)
         print(f"✅ Database query successful - found {len(projects)} projects")
         
-        db.close()
         return True
         
     except Exception as e:
@@ -80,28 +80,56 @@ def validate_configuration():
         print(f"❌ Configuration validation failed: {e}")
         return False
 
+def server_workers(settings) -> int:
+    """
+    Number of uvicorn worker processes. WORKERS wins when set; otherwise
+    one per usable CPU, capped at 4. Debug runs (auto-reload) use one, and
+    so do runs without REDIS_URL: the response cache and rate limits then
+    live in process memory, and separate workers would not share them (a
+    cache invalidation in one worker would leave the others serving stale
+    responses).
+    
+    Uvicorn spawns its workers rather than forking them, so each one is a
+    fresh interpreter that imports the app and opens its own connection
+    pools; nothing is shared copy-on-write with this process. The cap keeps
+    that per-worker memory and startup cost bounded.
+    """
+    if settings.DEBUG:
+        return 1
+    if settings.WORKERS:
+        return max(1, settings.WORKERS)
+    if not settings.REDIS_URL:
+        return 1
+    # sched_getaffinity respects CPU pinning/cgroup limits where available
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return max(1, min(4, cpus or 1))
+
 def start_server():
     """Start the FastAPI server"""
     print("🚀 Starting FastAPI server...")
     
     try:
         import uvicorn
-        from app.main import app
         from app.core.config import settings
         
+        workers = server_workers(settings)
+        
         print(f"\n🌐 Server starting on http://{settings.HOST}:{settings.PORT}")
         print("📚 API Documentation: http://localhost:3047/docs")
         print("🏥 Health Check: http://localhost:3047/api/health")
         print("🗄️  Database Health: http://localhost:3047/api/health/database")
+        print(f"👷 Workers: {workers}")
         print("\nPress Ctrl+C to stop the server")
         print("-" * 60)
         
-        # Start the server
+        # Start the server by import string: spawned workers and the
+        # reloader import the app themselves, in their own process
         uvicorn.run(
-            app,
+            "app.main:app",
             host=settings.HOST,
             port=settings.PORT,
             reload=settings.DEBUG,
+            workers=workers,
             log_level="info"
         )
         
@@ -113,6 +141,37 @@ def start_server():
     
     return True
 
+async def run_validation() -> bool:
+    """
+    Run the validation steps. Imports and configuration don't touch the
+    database and run together in worker threads; database setup runs
+    once both have passed.
+    """
+    independent_steps = [
+        ("Import Testing", test_imports),
+        ("Configuration Validation", validate_configuration),
+    ]
+    
+    print(f"\n📋 {' + '.join(step_name for step_name, _ in independent_steps)}")
+    print("-" * 30)
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(step_func) for _, step_func in independent_steps)
+    )
+    for (step_name, _), passed in zip(independent_steps, results):
+        if not passed:
+            print(f"\n❌ {step_name} failed. Cannot proceed.")
+            return False
+    
+    print("\n📋 Database Setup")
+    print("-" * 30)
+    
+    if not await setup_database():
+        print("\n❌ Database Setup failed. Cannot proceed.")
+        return False
+    
+    return True
+
 def main():
     """Main execution function"""
     print("🚀 CODEBRIDGE SYSTEM STARTUP")
@@ -121,19 +180,8 @@ def main():
     print()
     
     # Run validation steps
-    steps = [
-        ("Import Testing", test_imports),
-        ("Configuration Validation", validate_configuration),
-        ("Database Setup", setup_database),
-    ]
-    
-    for step_name, step_func in steps:
-        print(f"\n📋 {step_name}")
-        print("-" * 30)
-        
-        if not step_func():
-            print(f"\n❌ {step_name} failed. Cannot proceed.")
-            return False
+    if not asyncio.run(run_validation()):
+        return False
     
     print(f"\n✅ All validation steps passed!")
     print("🎉 System is ready to start!")
@@ -2,10 +2,15 @@
 Simple server startup test for CodeBridge
 """
 import subprocess
-import time
 import requests
 import sys
 
+from server_check import wait_until_ready
+
+# One keep-alive connection pool for every probe
+session = requests.Session()
+
+
 def test_server_startup():
     """Test if the server starts and responds correctly"""
     print("🚀 Testing CodeBridge Server Startup on Port 3047")
@@ -23,14 +28,18 @@ def test_server_startup():
         
         # Wait for server to start
         print("2. Waiting for server to start...")
-        time.sleep(5)
+        if not wait_until_ready("http://localhost:3047/api/health/simple", process=process):
+            print("   ❌ Server did not become ready")
+            process.terminate()
+            process.wait()
+            return False
         
         # Test endpoints
         print("3. Testing endpoints...")
         
         # Test root endpoint
         try:
-            response = requests.get("http://localhost:3047/", timeout=10)
+            response = session.get("http://localhost:3047/", timeout=10)
             if response.status_code == 200:
                 print("   ✅ Root endpoint (/) - Status 200")
                 print(f"   📄 Response: {response.json()}")
@@ -41,7 +50,7 @@ def test_server_startup():
         
         # Test health endpoint
         try:
-            response = requests.get("http://localhost:3047/api/health", timeout=10)
+            response = session.get("http://localhost:3047/api/health", timeout=10)
             if response.status_code == 200:
                 print("   ✅ Health endpoint (/api/health) - Status 200")
                 data = response.json()
@@ -54,7 +63,7 @@ def test_server_startup():
         
         # Test simple health endpoint
         try:
-            response = requests.get("http://localhost:3047/api/health/simple", timeout=10)
+            response = session.get("http://localhost:3047/api/health/simple", timeout=10)
             if response.status_code == 200:
                 print("   ✅ Simple health endpoint (/api/health/simple) - Status 200")
             else:
@@ -7,7 +7,6 @@ Run this after starting the server to validate all functionality.
 """
 
 import requests
-import json
 import time
 import sys
 
@@ -6,11 +6,22 @@ import pytest
 from fastapi.testclient import TestClient
 import sys
 import os
+import tempfile
 
 # Add the parent directory to the path so we can import app
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Run against a throwaway SQLite database (set before the app reads its
+# settings), with the rate limit out of the way of the API tests
+_TEST_DB = os.path.join(tempfile.mkdtemp(prefix="codebridge-tests-"), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_TEST_DB}"
+os.environ["RATE_LIMIT_PER_MINUTE"] = "100000"
+
 from app.main import app
+from app.core.database import create_tables, drop_tables, engine
+from fastapi_cache import FastAPICache
+from sqlalchemy import text
 
 
 @pytest.fixture
@@ -26,3 +37,40 @@ def test_settings():
     settings.DEBUG = True
     settings.LOG_LEVEL = "DEBUG"
     return settings
+
+
+@pytest.fixture
+def api_client():
+    """
+    Test client on empty tables, with the app's lifespan running (so the
+    response cache is initialized, and starts empty)
+    """
+    drop_tables()
+    create_tables()
+    with TestClient(app) as client:
+        # The in-memory cache backend keeps its entries across app restarts
+        client.portal.call(FastAPICache.clear)
+        yield client
+
+
+@pytest.fixture
+def auth_headers(api_client: TestClient):
+    """Authorization header for the demo admin user (all permissions)"""
+    response = api_client.post("/api/auth/login", data={"username": "admin", "password": "admin123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def fts_rowids(api_client: TestClient):
+    """
+    Look up a term in one of the SQLite FTS5 tag/topic indexes directly,
+    returning the matching rowids (what the index holds, not the table)
+    """
+    def lookup(fts_table: str, term: str) -> set:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :phrase"),
+                {"phrase": f'"{term}"'}
+            )
+            return {row[0] for row in rows}
+    return lookup
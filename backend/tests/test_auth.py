@@ -0,0 +1,42 @@
+"""
+Test JWT verification
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core import auth
+from app.core.auth import AuthenticationError, create_access_token, verify_token
+
+
+def test_verify_token_returns_independent_copies():
+    """Test that mutating one request's TokenData doesn't leak into the next"""
+    token = create_access_token({"sub": "alice", "permissions": ["read"]})
+    
+    first = verify_token(token)
+    first.permissions.append("admin")
+    first.username = "mallory"
+    
+    second = verify_token(token)
+    assert second.username == "alice"
+    assert second.permissions == ["read"]
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    """Test that a token already in the decode cache is rejected once exp passes"""
+    token = create_access_token({"sub": "alice", "permissions": ["read"]}, expires_delta=timedelta(minutes=5))
+    assert verify_token(token).username == "alice"
+    
+    real_time = time.time
+    monkeypatch.setattr(auth.time, "time", lambda: real_time() + 600)
+    with pytest.raises(AuthenticationError):
+        verify_token(token)
+
+
+def test_invalid_token_rejected():
+    """Test that a token with a bad signature is rejected"""
+    token = create_access_token({"sub": "alice"}) + "x"
+    with pytest.raises(AuthenticationError):
+        verify_token(token)
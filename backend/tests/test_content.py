@@ -0,0 +1,245 @@
+"""
+Test content endpoints
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def project_id(api_client: TestClient, auth_headers: dict) -> int:
+    """ID of a freshly created project to attach content to"""
+    response = api_client.post(
+        "/api/projects",
+        json={"platform": "github", "url": "https://github.com/test/content", "name": "Content Test"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()["data"]["id"]
+
+
+def _content(project_id: int, slug: str, tags=("test",)) -> dict:
+    return {
+        "project_id": project_id,
+        "content_type": "blog",
+        "title": f"Post {slug}",
+        "slug": slug,
+        "raw_content": "Some text",
+        "tags": list(tags)
+    }
+
+
+def _export_rows(client: TestClient, **params) -> list:
+    """GET the CSV export and parse it into dicts keyed by the header row"""
+    response = client.get("/api/content/export", params=params)
+    assert response.status_code == 200
+    return list(csv.DictReader(io.StringIO(response.text)))
+
+
+def _slugs_tagged(client: TestClient, tag: str) -> set:
+    response = client.get("/api/content", params={"tag": tag})
+    assert response.status_code == 200
+    return {item["slug"] for item in response.json()["data"]}
+
+
+def test_bulk_create_content(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test creating a batch of content in one request"""
+    batch = [_content(project_id, f"bulk-{i}") for i in range(3)]
+    response = api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["data"] == {"created": 3, "skipped": 0}
+    
+    response = api_client.get("/api/content")
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 3
+
+
+def test_bulk_create_content_skips_existing_slugs(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that items whose slug already exists are skipped"""
+    api_client.post("/api/content/bulk", json=[_content(project_id, "dup")], headers=auth_headers)
+    
+    batch = [_content(project_id, "dup"), _content(project_id, "new")]
+    response = api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["data"] == {"created": 1, "skipped": 1}
+
+
+def test_bulk_create_content_missing_project(api_client: TestClient, auth_headers: dict):
+    """Test that a batch referencing a missing project is rejected with 404"""
+    response = api_client.post("/api/content/bulk", json=[_content(999, "orphan")], headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_update_content_rejects_null_status(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that an explicit null status is a validation error, not a server error"""
+    api_client.post("/api/content/bulk", json=[_content(project_id, "post")], headers=auth_headers)
+    content_id = api_client.get("/api/content").json()["data"][0]["id"]
+    
+    response = api_client.put(f"/api/content/{content_id}", json={"status": None}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_filter_by_tag_matches_whole_elements(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that the tag filter matches a whole tag, never a substring of one"""
+    batch = [
+        _content(project_id, "python", tags=["python"]),
+        _content(project_id, "python-web", tags=["python-web", "django"]),
+    ]
+    api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    
+    assert _slugs_tagged(api_client, "python") == {"python"}
+    assert _slugs_tagged(api_client, "python-web") == {"python-web"}
+    assert _slugs_tagged(api_client, "pyth") == set()
+    assert _slugs_tagged(api_client, "web") == set()
+
+
+def test_filter_by_tag_with_punctuation(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test tags with punctuation and quotes, and punctuation-only tags"""
+    batch = [
+        _content(project_id, "cpp", tags=["c++"]),
+        _content(project_id, "c", tags=["c"]),
+        _content(project_id, "quoted", tags=['a"b']),
+        _content(project_id, "plus", tags=["++"]),
+    ]
+    api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    
+    assert _slugs_tagged(api_client, "c++") == {"cpp"}
+    assert _slugs_tagged(api_client, "c") == {"c"}
+    assert _slugs_tagged(api_client, 'a"b') == {"quoted"}
+    assert _slugs_tagged(api_client, "a") == set()
+    # No word characters: matched on the JSON text alone
+    assert _slugs_tagged(api_client, "++") == {"plus"}
+    assert _slugs_tagged(api_client, "+") == set()
+
+
+def test_tag_index_follows_update_and_delete(api_client: TestClient, auth_headers: dict, project_id: int,
+                                             fts_rowids):
+    """Test that the tags search index is kept in sync with updated and deleted rows"""
+    batch = [_content(project_id, "first", tags=["python"]), _content(project_id, "second", tags=["python"])]
+    api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    ids = {item["slug"]: item["id"] for item in api_client.get("/api/content").json()["data"]}
+    
+    response = api_client.put(f"/api/content/{ids['first']}", json={"tags": ["rust"]}, headers=auth_headers)
+    assert response.status_code == 200
+    assert _slugs_tagged(api_client, "rust") == {"first"}
+    assert _slugs_tagged(api_client, "python") == {"second"}
+    assert fts_rowids("content_tags_fts", "python") == {ids["second"]}
+    
+    response = api_client.delete(f"/api/content/{ids['second']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert _slugs_tagged(api_client, "python") == set()
+    assert fts_rowids("content_tags_fts", "python") == set()
+    assert fts_rowids("content_tags_fts", "rust") == {ids["first"]}
+
+
+def test_export_writes_tags_as_json(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that the CSV export writes tags as a JSON array"""
+    batch = [_content(project_id, "tagged", tags=["python", 'a"b']), _content(project_id, "untagged", tags=[])]
+    api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    
+    rows = {row["slug"]: row for row in _export_rows(api_client)}
+    assert json.loads(rows["tagged"]["tags"]) == ["python", 'a"b']
+    assert json.loads(rows["untagged"]["tags"]) == []
+
+
+def test_export_header_row(api_client: TestClient):
+    """Test that the export starts with the column header, even with no content"""
+    response = api_client.get("/api/content/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    
+    lines = response.text.splitlines()
+    assert lines == [
+        "id,project_id,content_type,title,slug,raw_content,"
+        "enhanced_content,meta_description,tags,status,created_at"
+    ]
+
+
+def test_export_filtered(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that the export applies the list filters"""
+    batch = [_content(project_id, "python", tags=["python"]), _content(project_id, "rust", tags=["rust"])]
+    api_client.post("/api/content/bulk", json=batch, headers=auth_headers)
+    
+    assert {row["slug"] for row in _export_rows(api_client)} == {"python", "rust"}
+    
+    rows = _export_rows(api_client, tag="rust")
+    assert [row["slug"] for row in rows] == ["rust"]
+    assert rows[0]["project_id"] == str(project_id)
+    assert rows[0]["raw_content"] == "Some text"
+    assert rows[0]["status"] == "draft"
+
+
+def test_export_empty_result(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that a filter matching nothing exports only the header row"""
+    api_client.post("/api/content/bulk", json=[_content(project_id, "post")], headers=auth_headers)
+    
+    assert _export_rows(api_client, project_id=project_id + 1) == []
+    assert _export_rows(api_client, status="published") == []
+
+
+def test_get_content_streams_text_fields(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that a streamed body decodes to the non-streamed payload plus the text fields"""
+    # Longer than two substr() chunks (262144 characters), with characters
+    # that need JSON escaping and multi-byte UTF-8
+    raw_content = ('Line "one" \\ é ✓\n' * 40000)[:600000]
+    item = {**_content(project_id, "long"), "raw_content": raw_content, "enhanced_content": "Short"}
+    api_client.post("/api/content/bulk", json=[item], headers=auth_headers)
+    content_id = api_client.get("/api/content").json()["data"][0]["id"]
+    
+    plain = api_client.get(f"/api/content/{content_id}")
+    assert plain.status_code == 200
+    expected = plain.json()
+    expected["data"].update(raw_content=raw_content, enhanced_content="Short")
+    
+    streamed = api_client.get(f"/api/content/{content_id}?include_raw=true&include_enhanced=true")
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "application/json"
+    assert json.loads(streamed.content) == expected
+
+
+def test_get_content_stream_not_found(api_client: TestClient):
+    """Test that missing content is a 404 before any streaming starts"""
+    response = api_client.get("/api/content/999?include_raw=true")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Content with ID 999 not found"
+
+
+def test_create_content_conflicts(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that single create maps constraint violations to 409/404"""
+    response = api_client.post("/api/content", json=_content(project_id, "post"), headers=auth_headers)
+    assert response.status_code == 201
+    
+    # Duplicate slug: unique index
+    response = api_client.post("/api/content", json=_content(project_id, "post"), headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Content with slug 'post' already exists"
+    
+    # Unknown project: foreign key (enforced on SQLite with foreign_keys=ON)
+    response = api_client.post("/api/content", json=_content(999, "orphan"), headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Project with ID 999 not found"
+    
+    assert {item["slug"] for item in api_client.get("/api/content").json()["data"]} == {"post"}
+
+
+def test_update_content_conflicts(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that single update maps constraint violations to 409/404 and leaves the row unchanged"""
+    api_client.post("/api/content/bulk", json=[_content(project_id, "first"), _content(project_id, "second")],
+                    headers=auth_headers)
+    ids = {item["slug"]: item["id"] for item in api_client.get("/api/content").json()["data"]}
+    
+    response = api_client.put(f"/api/content/{ids['second']}", json={"slug": "first"}, headers=auth_headers)
+    assert response.status_code == 409
+    
+    response = api_client.put(f"/api/content/{ids['second']}", json={"project_id": 999}, headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Project with ID 999 not found"
+    
+    second = api_client.get(f"/api/content/{ids['second']}").json()["data"]
+    assert second["slug"] == "second"
+    assert second["project_id"] == project_id
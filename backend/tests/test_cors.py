@@ -0,0 +1,105 @@
+"""
+Test CORS handling: preflights and simple requests
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware import CORS_ALLOW_HEADERS, CORS_ALLOW_METHODS, WildcardCORSMiddleware
+
+
+def _preflight(client: TestClient, method: str, headers: str = None):
+    request_headers = {"Origin": "https://example.com", "Access-Control-Request-Method": method}
+    if headers is not None:
+        request_headers["Access-Control-Request-Headers"] = headers
+    return client.options("/api/projects", headers=request_headers)
+
+
+def test_preflight_allowed(client: TestClient):
+    """Test a preflight for an allowed method and headers"""
+    response = _preflight(client, "POST", "authorization, content-type")
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["access-control-allow-origin"] == "https://example.com"
+
+
+def test_preflight_disallowed_method(client: TestClient):
+    """Test that a preflight for a method the API doesn't allow is rejected"""
+    response = _preflight(client, "PATCH")
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS method"
+
+
+def test_preflight_disallowed_header(client: TestClient):
+    """Test that a preflight for a header the API doesn't allow is rejected"""
+    response = _preflight(client, "GET", "Content-Type, X-Custom-Header")
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS headers"
+
+
+def _simple_app(cors_middleware, **options) -> TestClient:
+    """Small app behind a CORS middleware, with a route that sets its own CORS headers"""
+    simple_app = FastAPI()
+    
+    @simple_app.get("/plain")
+    async def plain():
+        return {"ok": True}
+    
+    @simple_app.get("/preset")
+    async def preset():
+        return JSONResponse(
+            {"ok": True},
+            headers={"Access-Control-Allow-Origin": "https://other.example", "Vary": "Accept-Encoding"}
+        )
+    
+    simple_app.add_middleware(cors_middleware, **options)
+    return TestClient(simple_app)
+
+
+def _cors_headers(response) -> list:
+    return sorted(
+        (name.lower(), value) for name, value in response.headers.multi_items()
+        if name.lower().startswith("access-control-") or name.lower() == "vary"
+    )
+
+
+def test_simple_request_without_cookie(client: TestClient):
+    """Test that a simple request allows any origin, with credentials"""
+    response = client.get("/api/health/simple", headers={"Origin": "https://example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert "vary" not in response.headers
+
+
+def test_simple_request_with_cookie(client: TestClient):
+    """Test that a request with cookies gets its origin echoed"""
+    client.cookies.set("session", "abc")
+    response = client.get("/api/health/simple", headers={"Origin": "https://example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://example.com"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["vary"] == "Origin"
+
+
+@pytest.mark.parametrize("path", ["/plain", "/preset"])
+@pytest.mark.parametrize("cookie", [False, True])
+def test_simple_request_matches_starlette(path: str, cookie: bool):
+    """Test that simple responses carry the same CORS headers as Starlette's middleware"""
+    wildcard = _simple_app(WildcardCORSMiddleware)
+    starlette = _simple_app(
+        CORSMiddleware, allow_origins=["*"], allow_credentials=True,
+        allow_methods=list(CORS_ALLOW_METHODS), allow_headers=list(CORS_ALLOW_HEADERS)
+    )
+    headers = {"Origin": "https://example.com"}
+    if cookie:
+        headers["Cookie"] = "session=abc"
+    
+    expected = _cors_headers(starlette.get(path, headers=headers))
+    actual = _cors_headers(wildcard.get(path, headers=headers))
+    assert actual == expected
+    # Replaced, never duplicated
+    assert [name for name, _ in actual].count("access-control-allow-origin") == 1
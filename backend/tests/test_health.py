@@ -2,9 +2,13 @@
 Test health endpoints
 """
 
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import health
+
 
 def test_health_check(client: TestClient):
     """Test the health check endpoint"""
@@ -42,3 +46,61 @@ def test_root_endpoint(client: TestClient):
     assert "status" in data
     assert "timestamp" in data
     assert data["message"] == "Welcome to CodeBridge API"
+
+
+@pytest.fixture
+def db_probes(monkeypatch):
+    """
+    Empty health caches, a controllable clock for their TTLs, and counting
+    stand-ins for the connectivity check and statistics query
+    """
+    probes = SimpleNamespace(now=1000.0, connection_checks=0, stats_queries=0)
+    
+    async def fake_test_connection():
+        probes.connection_checks += 1
+        return True
+    
+    def fake_get_database_stats(db):
+        probes.stats_queries += 1
+        return {"total_projects": probes.stats_queries}
+    
+    monkeypatch.setattr(health, "_cache", {})
+    monkeypatch.setattr(health, "time", SimpleNamespace(monotonic=lambda: probes.now))
+    monkeypatch.setattr(health, "test_connection", fake_test_connection)
+    monkeypatch.setattr(health, "get_database_stats", fake_get_database_stats)
+    return probes
+
+
+def _database_health(client: TestClient, **params) -> dict:
+    response = client.get("/api/health/database", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_database_health_reuses_cached_results(client: TestClient, db_probes):
+    """Test that connectivity and statistics are reused within their TTLs"""
+    assert _database_health(client)["database"]["statistics"] == {"total_projects": 1}
+    assert _database_health(client)["database"]["statistics"] == {"total_projects": 1}
+    assert (db_probes.connection_checks, db_probes.stats_queries) == (1, 1)
+    
+    # Connectivity expires after 2 seconds, statistics after 30
+    db_probes.now += 2.5
+    _database_health(client)
+    assert (db_probes.connection_checks, db_probes.stats_queries) == (2, 1)
+    
+    db_probes.now += 30
+    assert _database_health(client)["database"]["statistics"] == {"total_projects": 2}
+    assert (db_probes.connection_checks, db_probes.stats_queries) == (3, 2)
+
+
+def test_database_health_full_recomputes(client: TestClient, db_probes):
+    """Test that full=true bypasses both caches, and refreshes them"""
+    _database_health(client)
+    
+    data = _database_health(client, full=True)
+    assert data["database"]["statistics"] == {"total_projects": 2}
+    assert (db_probes.connection_checks, db_probes.stats_queries) == (2, 2)
+    
+    # The fresh results are what later cached requests see
+    assert _database_health(client)["database"]["statistics"] == {"total_projects": 2}
+    assert (db_probes.connection_checks, db_probes.stats_queries) == (2, 2)
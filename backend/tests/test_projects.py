@@ -0,0 +1,151 @@
+"""
+Test project endpoints: response caching and cursor pagination
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.services.database_service import bulk_create_projects
+
+
+def _project(i: int, topics=()) -> dict:
+    return {
+        "platform": "github",
+        "url": f"https://github.com/test/project-{i}",
+        "name": f"Project {i}",
+        "topics": list(topics)
+    }
+
+
+def _names_with_topic(client: TestClient, topic: str) -> set:
+    response = client.get("/api/projects", params={"topic": topic})
+    assert response.status_code == 200
+    return {project["name"] for project in response.json()["data"]}
+
+
+def _insert_behind_api(*items: dict):
+    """Write projects straight to the database, without invalidating the cache"""
+    with SessionLocal() as db:
+        bulk_create_projects(db, list(items))
+
+
+@pytest.fixture
+def project_id(api_client: TestClient, auth_headers: dict) -> int:
+    """ID of a freshly created project"""
+    response = api_client.post("/api/projects", json=_project(0), headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["data"]["id"]
+
+
+def test_list_projects_cache_hit(api_client: TestClient, project_id: int):
+    """Test that a repeated list request is answered from the cache"""
+    first = api_client.get("/api/projects")
+    assert first.status_code == 200
+    assert first.json()["total"] == 1
+    
+    _insert_behind_api(_project(1))
+    
+    second = api_client.get("/api/projects")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    
+    # A different query is a different cache entry
+    assert api_client.get("/api/projects?limit=10").json()["total"] == 2
+
+
+def test_update_project_invalidates_cache(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that PUT clears cached project responses"""
+    assert api_client.get(f"/api/projects/{project_id}").json()["data"]["name"] == "Project 0"
+    api_client.get("/api/projects")
+    
+    response = api_client.put(f"/api/projects/{project_id}", json={"name": "Renamed"}, headers=auth_headers)
+    assert response.status_code == 200
+    
+    assert api_client.get(f"/api/projects/{project_id}").json()["data"]["name"] == "Renamed"
+    assert api_client.get("/api/projects").json()["data"][0]["name"] == "Renamed"
+
+
+def test_delete_project_invalidates_cache(api_client: TestClient, auth_headers: dict, project_id: int):
+    """Test that DELETE clears cached project responses"""
+    assert api_client.get(f"/api/projects/{project_id}").status_code == 200
+    assert api_client.get("/api/projects").json()["total"] == 1
+    
+    response = api_client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+    assert response.status_code == 200
+    
+    assert api_client.get(f"/api/projects/{project_id}").status_code == 404
+    assert api_client.get("/api/projects").json()["total"] == 0
+
+
+def test_cursor_pagination(api_client: TestClient):
+    """Test following next_cursor across pages from an offset first page"""
+    _insert_behind_api(*(_project(i) for i in range(5)))
+    
+    page = api_client.get("/api/projects?limit=2").json()
+    assert page["total"] == 5
+    assert page["pages"] == 3
+    seen = [project["url"] for project in page["data"]]
+    
+    while page["next_cursor"]:
+        response = api_client.get(f"/api/projects?limit=2&cursor={page['next_cursor']}")
+        assert response.status_code == 200
+        page = response.json()
+        # Cursor pages don't repeat the count
+        assert page["total"] is None
+        assert page["page"] is None
+        seen.extend(project["url"] for project in page["data"])
+    
+    assert seen == [_project(i)["url"] for i in range(5)]
+
+
+def test_invalid_cursor(api_client: TestClient):
+    """Test that a malformed cursor is a client error"""
+    response = api_client.get("/api/projects?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_filter_by_topic_matches_whole_elements(api_client: TestClient):
+    """Test that the topic filter matches a whole topic, never a substring of one"""
+    _insert_behind_api(_project(1, topics=["python"]), _project(2, topics=["python-web", "django"]))
+    
+    assert _names_with_topic(api_client, "python") == {"Project 1"}
+    assert _names_with_topic(api_client, "python-web") == {"Project 2"}
+    assert _names_with_topic(api_client, "pyth") == set()
+    assert _names_with_topic(api_client, "web") == set()
+
+
+def test_filter_by_topic_with_punctuation(api_client: TestClient):
+    """Test topics with punctuation and quotes, and punctuation-only topics"""
+    _insert_behind_api(
+        _project(1, topics=["c++"]),
+        _project(2, topics=["c"]),
+        _project(3, topics=['a"b']),
+        _project(4, topics=["++"]),
+    )
+    
+    assert _names_with_topic(api_client, "c++") == {"Project 1"}
+    assert _names_with_topic(api_client, "c") == {"Project 2"}
+    assert _names_with_topic(api_client, 'a"b') == {"Project 3"}
+    assert _names_with_topic(api_client, "a") == set()
+    # No word characters: matched on the JSON text alone
+    assert _names_with_topic(api_client, "++") == {"Project 4"}
+    assert _names_with_topic(api_client, "+") == set()
+
+
+def test_topic_index_follows_update_and_delete(api_client: TestClient, auth_headers: dict, fts_rowids):
+    """Test that the topics search index is kept in sync with updated and deleted rows"""
+    _insert_behind_api(_project(1, topics=["python"]), _project(2, topics=["python"]))
+    ids = {project["name"]: project["id"] for project in api_client.get("/api/projects").json()["data"]}
+    
+    response = api_client.put(f"/api/projects/{ids['Project 1']}", json={"topics": ["rust"]}, headers=auth_headers)
+    assert response.status_code == 200
+    assert _names_with_topic(api_client, "rust") == {"Project 1"}
+    assert _names_with_topic(api_client, "python") == {"Project 2"}
+    assert fts_rowids("projects_topics_fts", "python") == {ids["Project 2"]}
+    
+    response = api_client.delete(f"/api/projects/{ids['Project 2']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert _names_with_topic(api_client, "python") == set()
+    assert fts_rowids("projects_topics_fts", "python") == set()
+    assert fts_rowids("projects_topics_fts", "rust") == {ids["Project 1"]}
@@ -0,0 +1,73 @@
+"""
+Test rate limiting middleware
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import auth
+from app.core.auth import RateLimiter
+from app.core.middleware import RATE_LIMIT_EXEMPT_PATHS, RateLimitMiddleware
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the rate limiter, starting at a window boundary"""
+    now = SimpleNamespace(value=60.0 * 1000)
+    monkeypatch.setattr(auth, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def limited_client(clock) -> TestClient:
+    """Small app behind RateLimitMiddleware with a limit of 2 requests per minute"""
+    limited_app = FastAPI()
+    
+    @limited_app.get("/")
+    async def root():
+        return {"ok": True}
+    
+    @limited_app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+    
+    limited_app.add_middleware(RateLimitMiddleware, limiter=RateLimiter(requests_per_minute=2))
+    return TestClient(limited_app)
+
+
+def test_rate_limit_exceeded(limited_client: TestClient):
+    """Test that the request over the limit gets a 429 JSON error"""
+    assert limited_client.get("/api/ping").status_code == 200
+    assert limited_client.get("/api/ping").status_code == 200
+    
+    response = limited_client.get("/api/ping")
+    assert response.status_code == 429
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": "Rate limit exceeded. Please try again later."}
+
+
+def test_rate_limit_exempt_paths(limited_client: TestClient):
+    """Test that exempt paths are never limited, nor counted"""
+    for _ in range(5):
+        for path in RATE_LIMIT_EXEMPT_PATHS:
+            assert limited_client.get(path).status_code != 429
+    
+    assert limited_client.get("/api/ping").status_code == 200
+
+
+def test_rate_limit_resets_with_window(limited_client: TestClient, clock):
+    """Test that counts start over when the one-minute window changes"""
+    for _ in range(2):
+        limited_client.get("/api/ping")
+    assert limited_client.get("/api/ping").status_code == 429
+    
+    clock.value += 59
+    assert limited_client.get("/api/ping").status_code == 429
+    
+    clock.value += 1
+    assert limited_client.get("/api/ping").status_code == 200
+    assert limited_client.get("/api/ping").status_code == 200
+    assert limited_client.get("/api/ping").status_code == 429